@@ -96,11 +96,20 @@ class TransitionMode(Enum):
                 return mode
         return cls.SMOOTH
     
+    def next(self) -> 'TransitionMode':
+        """Return the mode after this one in cycling order, wrapping to the first."""
+        return _TRANSITION_MODE_SUCCESSORS[self]
+    
     def __str__(self) -> str:
         """Return the string value of the transition mode."""
         return self.value
 
 
+# Successor of each transition mode in definition order, built once for TransitionMode.next()
+_TRANSITION_MODES = list(TransitionMode)
+_TRANSITION_MODE_SUCCESSORS = dict(zip(_TRANSITION_MODES, _TRANSITION_MODES[1:] + _TRANSITION_MODES[:1]))
+
+
 class OverlayEffect(Enum):
     """Ghost overlay effect types."""
     OUTLINE = auto()     # Ghost pixels around text edges
@@ -10,7 +10,6 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Any, Union
 from config.enums import DisplayType, ColorScheme, TransitionMode, OverlayEffect, RGB, DEFAULT_DISPLAY_TYPE, DEFAULT_COLOR_SCHEME, DEFAULT_TRANSITION_MODE, DEFAULT_OVERLAY_EFFECT
 import json
-import os
 
 
 @dataclass
@@ -506,23 +505,33 @@ class Settings:
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Settings':
         """Load settings from a JSON file. Returns default settings if file doesn't exist or is invalid."""
-        if not os.path.exists(filepath):
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
             print(f"Settings file {filepath} not found. Using defaults.")
             return cls.create_default()
-        
+        except Exception as e:
+            print(f"Error loading settings from {filepath}: {e}. Using defaults.")
+            return cls.create_default()
+        return cls.load_from_bytes(data, filepath)[0]
+    
+    @classmethod
+    def load_from_bytes(cls, data: bytes, filepath: str) -> Tuple['Settings', bool]:
+        """Load settings from the raw contents of a JSON settings file read from filepath.
+        Returns (settings, clean); if the contents are invalid, clean is False and
+        the settings are the defaults."""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            settings = cls.from_dict(data)
+            settings = cls.from_dict(json.loads(data))
             if settings.validate():
                 print(f"Settings loaded from: {filepath}")
-                return settings
+                return settings, True
             else:
                 print(f"Invalid settings in {filepath}. Using defaults.")
-                return cls.create_default()
+                return cls.create_default(), False
         except Exception as e:
             print(f"Error loading settings from {filepath}: {e}. Using defaults.")
-            return cls.create_default()
+            return cls.create_default(), False
     
     def apply_to_displayer(self, displayer) -> None:
         """Apply these settings to a ScreenDisplayer instance."""
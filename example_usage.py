@@ -4,6 +4,7 @@ from transition_manager import TransitionManager
 from config.settings import Settings, create_transgender_pride_settings, create_demo_settings
 from config.enums import DisplayType, ColorScheme, TransitionMode
 import os
+import logging
 
 def animate_example():
     try:
@@ -116,6 +117,7 @@ def animate_example():
         
         # Run the display with transition manager using settings-based FPS
         displayer.run(fps=settings.display.fps, transition_manager=transition_manager)
+        transition_manager.stop_file_monitoring()
             
     except Exception as e:
         print(f"Error in animate_example: {e}")
@@ -125,4 +127,7 @@ def animate_example():
         pygame.quit()
 
 if __name__ == "__main__":
+    # Per-transition detail is logged at DEBUG; set SCREEN_DEBUG=1 to see it
+    logging.basicConfig(level=logging.DEBUG if os.environ.get("SCREEN_DEBUG") == "1" else logging.INFO,
+                        format="%(message)s")
     animate_example()
@@ -345,16 +345,7 @@ class ScreenDisplayer:
                     current_mode = self.overlay.color_transition_mode
                     
                     # Cycle through enum modes
-                    if current_mode == TransitionMode.SMOOTH:
-                        new_mode = TransitionMode.SNAP
-                    elif current_mode == TransitionMode.SNAP:
-                        new_mode = TransitionMode.MIXED
-                    elif current_mode == TransitionMode.MIXED:
-                        new_mode = TransitionMode.SPREAD_HORIZONTAL
-                    elif current_mode == TransitionMode.SPREAD_HORIZONTAL:
-                        new_mode = TransitionMode.SPREAD_VERTICAL
-                    else:  # SPREAD_VERTICAL
-                        new_mode = TransitionMode.SMOOTH
+                    new_mode = current_mode.next()
                     
                     self.set_color_transition_mode(new_mode)
                     print(f"Color transition mode changed to: {new_mode.value}")
@@ -8,28 +8,274 @@ alongside the main display application with file-based settings synchronization.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import os
-from typing import Optional, Dict, Any, Callable
+import copy
+import tempfile
+import threading
+from functools import lru_cache, partial
+from itertools import islice
+from operator import attrgetter
+import concurrent.futures
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, Callable, Tuple, List
 from config.settings import (
     Settings, 
+    TransitionSettings, 
     create_demo_settings, 
     create_transgender_pride_settings, 
     create_performance_settings
 )
 from config.enums import DisplayType, ColorScheme, TransitionMode, OverlayEffect
 
+# Combobox choices; the enums are fixed, so list them once at import
+_COLOR_SCHEME_NAMES = tuple(ColorScheme.list_names())
+_TRANSITION_MODE_NAMES = tuple(TransitionMode.list_names())
+
+# Slider readout formats mapped to C-level %-formatting; others fall back to str.format
+_FORMATTERS: Dict[str, Callable[[float], str]] = {
+    "{:.1f}": "%.1f".__mod__,
+    "{:.2f}": "%.2f".__mod__,
+    "{:.3f}": "%.3f".__mod__,
+    "{:.4f}": "%.4f".__mod__,
+}
+
+def _is_int_text(text: str) -> bool:
+    """Spinbox validatecommand: accept empty or (optionally negative) integer text."""
+    return text == '' or text.removeprefix('-').isdigit()
+
+
+# Frame-count readout templates (%-formatting reuses the parsed template)
+_BLANK_FMT = "%d (%.1fs @ 60fps)"
+_AVERAGING_FMT = "%d (%.2fs @ 60fps)"
+_SECONDS_FMT = "(%.1fs @ 60fps)"
+_INV_60 = 1.0 / 60.0  # seconds per frame at 60 FPS
+
+# Readouts for every frame count the blank time (0-600) and averaging (<=180) scales can produce
+_BLANK_READOUTS = tuple(_BLANK_FMT % (i, i * _INV_60) for i in range(601))
+_AVERAGING_READOUTS = tuple(_AVERAGING_FMT % (i, i * _INV_60) for i in range(181))
+
+def _frame_readout(frames: int, table: Tuple[str, ...], fmt: str) -> str:
+    """Look up a precomputed readout, formatting counts outside the table (e.g. from a settings file)."""
+    if 0 <= frames < len(table):
+        return table[frames]
+    return fmt % (frames, frames * _INV_60)
+
+
+# Scroll units for the common single-notch wheel deltas and X11 wheel buttons
+_WHEEL = {120: -1, -120: 1}
+_WHEEL_BUTTONS = {4: -1, 5: 1}
+
+def _wheel_units(event) -> int:
+    """Scroll units for a wheel event: X11 buttons 4/5, else Windows/macOS delta."""
+    units = _WHEEL_BUTTONS.get(event.num) or _WHEEL.get(event.delta)
+    return units or int(-1*(event.delta/120))
+
+
+# Named ttk style for the Random/Sequential order radio pairs
+_RADIO_STYLE = "Compact.TRadiobutton"
+
+def _radio_pair(parent, var: tk.StringVar, row: int, padx: int = 20):
+    """Grid a Random/Sequential radio pair for an order setting on the given row."""
+    ttk.Radiobutton(parent, text="Random", variable=var, value="random",
+                    style=_RADIO_STYLE).grid(row=row, column=0, sticky="w", padx=padx)
+    ttk.Radiobutton(parent, text="Sequential", variable=var, value="sequential",
+                    style=_RADIO_STYLE).grid(row=row, column=1, sticky="w")
+
+
+# Default grid options for label/control rows
+_GRID_DEFAULTS = {'sticky': "w", 'padx': 5, 'pady': 5}
+
+# Characters read per chunk when counting a text file's blocks
+_TEXT_INFO_CHUNK = 1 << 16
+
+@lru_cache(maxsize=8)
+def _read_text_file_info(file_path: str, mtime_ns: int, file_size: int) -> Tuple[str, str]:
+    """Read (info text, preview text) for a text file; mtime_ns and size key the cache."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        # Preview only the first 20 lines (21 read to detect truncation)
+        preview_lines = list(islice(f, 21))
+        
+        # Count blocks and characters over the rest in chunks from the same handle. A trailing
+        # run of newlines is carried into the next chunk so '\n\n' pairs split across chunks
+        # count the same as in one str.count over the whole text.
+        text = ''.join(preview_lines)
+        char_count = 0
+        separators = 0
+        newline_run = ''
+        while text:
+            char_count += len(text)
+            text = newline_run + text
+            body = text.rstrip('\n')
+            newline_run = text[len(body):]
+            separators += body.count('\n\n')
+            text = f.read(_TEXT_INFO_CHUNK)
+        separators += newline_run.count('\n\n')
+    line_count = separators + 1 if char_count else 0  # Count text blocks
+    
+    info = f"Size: {file_size} bytes | Blocks: {line_count} | Characters: {char_count}"
+    preview = ''.join(preview_lines[:20]).rstrip('\n')
+    if len(preview_lines) > 20:
+        preview += "\n\n... (truncated)"
+    return info, preview
+
+
+def _parse_settings_file(path: str) -> Tuple[Settings, bool]:
+    """Parse a settings file into (settings, clean).
+    
+    clean is False if the file could not be fully parsed or fails validation;
+    the settings are then the defaults Settings.load_from_file falls back to.
+    Raises OSError (e.g. FileNotFoundError) if the file cannot be read.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return Settings.load_from_bytes(data, path)
+
+
+# Parsed settings files: abspath -> (st_mtime_ns, st_size, Settings, clean)
+# Used from both the Tk thread and the I/O worker, so access goes through _SETTINGS_CACHE_LOCK
+_SETTINGS_CACHE: Dict[str, Tuple[int, int, Settings, bool]] = {}
+_SETTINGS_CACHE_LOCK = threading.Lock()
+
+
+def _load_settings_cached(path: str) -> Tuple[Settings, bool]:
+    """Load a settings file as (settings, clean), reusing the parse while its mtime and size are unchanged.
+    
+    Returns a deep copy of the settings so callers can edit it freely; clean is
+    as for _parse_settings_file. Raises OSError (e.g. FileNotFoundError) if the
+    file cannot be stat'ed or read.
+    """
+    abspath = os.path.abspath(path)
+    st = os.stat(abspath)
+    with _SETTINGS_CACHE_LOCK:
+        cached = _SETTINGS_CACHE.get(abspath)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        # Parse outside the lock so the other thread is never held up by file I/O
+        cached = (st.st_mtime_ns, st.st_size, *_parse_settings_file(abspath))
+        with _SETTINGS_CACHE_LOCK:
+            _SETTINGS_CACHE[abspath] = cached
+    return copy.deepcopy(cached[2]), cached[3]  # Cached entries are never mutated, so copying needs no lock
+
+
+@dataclass
+class SharedVars:
+    """Tk variables shared by the Transitions and Advanced tabs.
+    
+    Created before any tab is built so either tab can be built first. Each
+    field maps to the transition setting of the same name minus "_var".
+    """
+    speed_min_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    speed_max_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    ghost_chance_min_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    ghost_chance_max_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    ghost_decay_min_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    ghost_decay_max_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    flicker_chance_min_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    flicker_chance_max_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    flicker_intensity_min_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    flicker_intensity_max_var: tk.DoubleVar = field(default_factory=tk.DoubleVar)
+    
+    def bindings(self):
+        """Yield (settings_path, variable) pairs for saving."""
+        for f in fields(self):
+            yield f"transition.{f.name[:-4]}", getattr(self, f.name)
+    
+    def update_from(self, transition: TransitionSettings):
+        """Set every shared variable from the given transition settings."""
+        for f in fields(self):
+            getattr(self, f.name).set(getattr(transition, f.name[:-4]))
+
 
 class SettingsGUI:
     """Main settings GUI application with tabbed interface."""
     
+    # Advanced tab range sliders: (row, label, SharedVars field, from, to, readout format)
+    _ADVANCED_SLIDER_SPECS = (
+        (2, "Speed Min (px/frame):", "speed_min_var", 0.1, 50.0, "{:.1f}"),
+        (3, "Speed Max (px/frame):", "speed_max_var", 0.1, 50.0, "{:.1f}"),
+        (5, "Ghost Chance Min:", "ghost_chance_min_var", 0.0, 1.0, "{:.3f}"),
+        (6, "Ghost Chance Max:", "ghost_chance_max_var", 0.0, 1.0, "{:.3f}"),
+        (7, "Ghost Decay Min:", "ghost_decay_min_var", 0.9, 1.0, "{:.4f}"),
+        (8, "Ghost Decay Max:", "ghost_decay_max_var", 0.9, 1.0, "{:.4f}"),
+        (10, "Flicker Chance Min:", "flicker_chance_min_var", 0.0, 0.2, "{:.3f}"),
+        (11, "Flicker Chance Max:", "flicker_chance_max_var", 0.0, 0.2, "{:.3f}"),
+        (12, "Flicker Intensity Min:", "flicker_intensity_min_var", 0.0, 1.0, "{:.3f}"),
+        (13, "Flicker Intensity Max:", "flicker_intensity_max_var", 0.0, 1.0, "{:.3f}"),
+    )
+    
+    # Effect transition sections: (title, checkbox text, check var attr, order var attr,
+    # range sliders as (label, SharedVars field, from, to, fmt), hint). Var attrs map to
+    # transition settings by dropping their "_var" suffix.
+    _EFFECT_TRANSITION_SECTIONS = (
+        ("Color Scheme Transitions", "Also transition color scheme when text changes",
+         "transition_color_scheme_var", "color_scheme_order_var", (),
+         "Cycles through all 23 available color schemes"),
+        ("Transition Mode Transitions", "Also transition color transition mode when text changes",
+         "transition_color_mode_var", "color_mode_order_var", (),
+         "Cycles through: smooth, snap, mixed, spread_horizontal, spread_vertical"),
+        ("Ghost Effect Transitions", "Also transition ghost effects when text changes",
+         "transition_ghost_params_var", "ghost_params_order_var", (
+             ("Ghost Chance Min:", "ghost_chance_min_var", 0.0, 1.0, "{:.3f}"),
+             ("Ghost Chance Max:", "ghost_chance_max_var", 0.0, 1.0, "{:.3f}"),
+             ("Ghost Decay Min:", "ghost_decay_min_var", 0.9, 1.0, "{:.4f}"),
+             ("Ghost Decay Max:", "ghost_decay_max_var", 0.9, 1.0, "{:.4f}"),
+         ), "Randomizes ghost parameters within specified ranges"),
+        ("Flicker Effect Transitions", "Also transition flicker effects when text changes",
+         "transition_flicker_params_var", "flicker_params_order_var", (
+             ("Flicker Chance Min:", "flicker_chance_min_var", 0.0, 0.2, "{:.3f}"),
+             ("Flicker Chance Max:", "flicker_chance_max_var", 0.0, 0.2, "{:.3f}"),
+             ("Flicker Intensity Min:", "flicker_intensity_min_var", 0.0, 1.0, "{:.3f}"),
+             ("Flicker Intensity Max:", "flicker_intensity_max_var", 0.0, 1.0, "{:.3f}"),
+         ), "Randomizes flicker parameters within specified ranges"),
+        ("Speed Variation", "Also vary transition speed when text changes",
+         "transition_speed_variation_var", "speed_order_var", (
+             ("Speed Min (px/frame):", "speed_min_var", 0.1, 50.0, "{:.1f}"),
+             ("Speed Max (px/frame):", "speed_max_var", 0.1, 50.0, "{:.1f}"),
+         ), "Randomizes transition speed within specified range"),
+    )
+    
+    # Bound settings paths: path -> (parent getter, attribute name), shared across windows
+    _PATH_GETTERS: Dict[str, Tuple[Callable[[Settings], object], str]] = {}
+    
+    # Text file listings: directory -> (st_mtime_ns, paths)
+    _DIR_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+    
     def __init__(self):
         self.root = tk.Tk()
         self.settings = Settings.create_default()
-        self.widget_bindings = {}  # Map widget -> (settings_path, converter)
+        self._bindings: List[Tuple[str, tk.Variable, Callable, Any]] = []  # (settings_path, variable, converter, default)
+        self._path_cache: Dict[str, Tuple[object, str]] = {}  # Map settings_path -> (parent object, attribute name)
         self.status_label = None  # Will be created in _create_control_buttons
+        self._status_after_id = None  # Pending auto-clear of the status label
+        self._last_saved_text_file = None  # Contents of config/current_text_file.txt as last read/written (Tk thread only)
+        self._pending_preview = None  # after() id of a debounced combobox preview
+        self._preview_token = 0  # Incremented per preview request; stale reads are ignored
+        self._text_file_info_loaded = False  # File info/preview is read when the Text Files tab is first shown
+        self._slider_labels: Dict[str, Tuple[tk.Variable, list]] = {}  # Map variable name -> (variable, label setters)
+        self._label_refreshers: List[Callable] = []  # Trace-driven readouts to resync after a batch
+        self._batching = False  # True inside _batch_update; readouts refresh when it exits
+        self._dirty = True  # Settings differ from what is on disk; cleared by load/save
+        self._basename = os.path.basename
+        self._config_dir_ensured = False  # makedirs("config") only needs to succeed once
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='settings-io')
+        self._int_vcmd = (self.root.register(_is_int_text), '%P')  # Registered once, shared by int spinboxes
+        
+        # Named fonts shared by every label of the same style
+        self._bold10 = self._derive_font(size=10, weight="bold")
+        self._bold9 = self._derive_font(size=9, weight="bold")
+        self._font9 = self._derive_font(size=9)
+        self._font8 = self._derive_font(size=8)
+        
+        # Range variables used by both the Transitions and Advanced tabs
+        self.shared = SharedVars()
+        self.shared.update_from(self.settings.transition)
+        for settings_path, var in self.shared.bindings():
+            self._bind_var(settings_path, var, float)
         
         self._setup_window()
         self._create_tabs()
+        self._status_config = self.status_label.config  # Pre-bound for _show_status
         self._load_current_settings()
         
     def _setup_window(self):
@@ -45,6 +291,9 @@ class SettingsGUI:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
+        # Style shared by every order radio pair, configured once per window
+        ttk.Style(self.root).configure(_RADIO_STYLE, padding=0)
+        
     def _create_tabs(self):
         """Create the tabbed interface with all settings categories."""
         # Create notebook for tabs
@@ -63,250 +312,233 @@ class SettingsGUI:
         self.notebook.add(self.transitions_frame, text="Transitions")
         self.notebook.add(self.advanced_frame, text="Advanced")
         
-        # Create tab content
+        # Only the first tab is built up front; the rest are built on first view
         self._create_display_tab()
-        self._create_effects_tab()
-        self._create_transitions_tab()
-        self._create_advanced_tab()
+        self._tab_builders: Dict[str, Callable] = {
+            str(self.effects_frame): self._create_effects_tab,
+            str(self.transitions_frame): self._create_transitions_tab,
+            str(self.advanced_frame): self._create_advanced_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Create control buttons at bottom
         self._create_control_buttons()
         
+    def _derive_font(self, **options) -> tkfont.Font:
+        """Create a named font from TkDefaultFont with the given overrides."""
+        font = tkfont.nametofont("TkDefaultFont", root=self.root).copy()
+        font.configure(**options)
+        return font
+        
+    @staticmethod
+    def _grid_many(specs):
+        """Grid (widget, row, column, options) specs, with options overriding _GRID_DEFAULTS."""
+        for widget, row, column, options in specs:
+            widget.grid(row=row, column=column, **{**_GRID_DEFAULTS, **options})
+        
+    def _on_tab_changed(self, event=None):
+        """Build a tab's content the first time it is selected."""
+        selected = self.notebook.select()
+        if not self._text_file_info_loaded and selected == str(self.display_frame):
+            self._text_file_info_loaded = True
+            self._update_file_info()
+        self._ensure_tab_built(selected)
+        
+    def _ensure_tab_built(self, frame_name: str):
+        """Run the pending builder for a tab frame once."""
+        builder = self._tab_builders.pop(frame_name, None)
+        if builder is not None:
+            builder()
+        
+    def _is_tab_built(self, frame) -> bool:
+        """Return True once a tab frame's widgets and variables exist."""
+        return str(frame) not in self._tab_builders
+        
     def _create_display_tab(self):
         """Create the Text Files tab content."""
         frame = self.display_frame
-        row = 0
-        
-        # Instructions
-        ttk.Label(frame, text="Select text file to display:", font=("TkDefaultFont", 10, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        row += 1
-        
-        # Text file selection
-        ttk.Label(frame, text="Text File:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
         
         # Get available text files
         text_files = self._get_available_text_files()
         self.current_text_file = "TextInputFiles/webcam_background.txt"  # Default
         
+        # Text file selection
         self.text_file_var = tk.StringVar(value=self.current_text_file)
         text_file_combo = ttk.Combobox(frame, textvariable=self.text_file_var, 
                                       values=text_files, width=40, state="readonly")
-        text_file_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
         text_file_combo.bind('<<ComboboxSelected>>', self._on_text_file_changed)
-        row += 1
         
         # Current file info
-        ttk.Label(frame, text="Current file info:", font=("TkDefaultFont", 9, "bold")).grid(
-            row=row, column=0, sticky="w", padx=5, pady=(15, 5))
-        row += 1
-        
         self.file_info_label = ttk.Label(frame, text="Loading...", foreground="gray")
-        self.file_info_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        row += 1
-        
-        # File preview area
-        ttk.Label(frame, text="Preview (first few lines):", font=("TkDefaultFont", 9, "bold")).grid(
-            row=row, column=0, sticky="nw", padx=5, pady=(15, 5))
-        row += 1
         
-        # Text preview with scrollbar
+        # Text preview with scrollbars; no wrapping (no reflow on update/resize) and no undo history
         preview_frame = ttk.Frame(frame)
-        preview_frame.grid(row=row, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
-        
-        self.preview_text = tk.Text(preview_frame, height=8, width=50, wrap=tk.WORD, 
-                                   state=tk.DISABLED, font=("Courier", 9))
+        self.preview_text = tk.Text(preview_frame, height=8, width=50, wrap=tk.NONE, 
+                                   state=tk.DISABLED, font=("Courier", 9),
+                                   undo=False, autoseparators=False, maxundo=0)
         scrollbar = ttk.Scrollbar(preview_frame, orient="vertical", command=self.preview_text.yview)
-        self.preview_text.configure(yscrollcommand=scrollbar.set)
+        h_scrollbar = ttk.Scrollbar(preview_frame, orient="horizontal", command=self.preview_text.xview)
+        self.preview_text.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         self.preview_text.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         preview_frame.grid_rowconfigure(0, weight=1)
         preview_frame.grid_columnconfigure(0, weight=1)
         
-        # Load initial file info
-        self._update_file_info()
-        row += 1
-        
         # Shuffle text order checkbox
-        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2,
-                                                       sticky="ew", padx=5, pady=10)
-        row += 1
-        
         self.shuffle_text_order_var = tk.BooleanVar(value=self.settings.transition.shuffle_text_order)
         shuffle_check = ttk.Checkbutton(frame, text="Shuffle text order (process messages in random sequence)",
                                        variable=self.shuffle_text_order_var)
-        shuffle_check.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        self._bind_widget(shuffle_check, "transition.shuffle_text_order", bool)
-        row += 1
+        self._bind_var("transition.shuffle_text_order", self.shuffle_text_order_var, bool)
+        
+        self._grid_many((
+            (ttk.Label(frame, text="Select text file to display:", font=self._bold10),
+             0, 0, {'columnspan': 2}),
+            (ttk.Label(frame, text="Text File:"), 1, 0, {}),
+            (text_file_combo, 1, 1, {}),
+            (ttk.Label(frame, text="Current file info:", font=self._bold9),
+             2, 0, {'pady': (15, 5)}),
+            (self.file_info_label, 3, 0, {'columnspan': 2}),
+            (ttk.Label(frame, text="Preview (first few lines):", font=self._bold9),
+             4, 0, {'sticky': "nw", 'pady': (15, 5)}),
+            (preview_frame, 5, 0, {'columnspan': 2, 'sticky': "nsew"}),
+            (ttk.Separator(frame, orient="horizontal"), 6, 0, {'columnspan': 2, 'sticky': "ew", 'pady': 10}),
+            (shuffle_check, 7, 0, {'columnspan': 2}),
+        ))
         
     def _create_effects_tab(self):
         """Create the Visual Effects tab content."""
         frame = self.effects_frame
+        o = self.settings.overlay
         row = 0
+        sliders = []  # (row, label, var, from, to, fmt), built together at the end
         
         # Overlay Enabled
-        self.overlay_enabled_var = tk.BooleanVar(value=self.settings.overlay.overlay_enabled)
+        self.overlay_enabled_var = tk.BooleanVar(value=o.overlay_enabled)
         overlay_check = ttk.Checkbutton(frame, text="Enable Overlay Effects", 
                                        variable=self.overlay_enabled_var)
         overlay_check.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        self._bind_widget(overlay_check, "overlay.overlay_enabled", bool)
+        self._bind_var("overlay.overlay_enabled", self.overlay_enabled_var, bool)
         row += 1
         
         # Color Scheme
         ttk.Label(frame, text="Color Scheme:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.color_scheme_var = tk.StringVar(value=self.settings.overlay.color_scheme.value)
-        color_schemes = ColorScheme.list_names()
+        self.color_scheme_var = tk.StringVar(value=o.color_scheme.value)
         color_combo = ttk.Combobox(frame, textvariable=self.color_scheme_var, 
-                                  values=color_schemes, width=20, state="readonly")
+                                  values=_COLOR_SCHEME_NAMES, width=20, state="readonly")
         color_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        self._bind_widget(color_combo, "overlay.color_scheme", ColorScheme.from_string)
+        self._bind_var("overlay.color_scheme", self.color_scheme_var, ColorScheme.from_string)
         row += 1
         
         # Transition Mode
         ttk.Label(frame, text="Transition Mode:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.transition_mode_var = tk.StringVar(value=self.settings.overlay.color_transition_mode.value)
-        transition_modes = TransitionMode.list_names()
+        self.transition_mode_var = tk.StringVar(value=o.color_transition_mode.value)
         transition_combo = ttk.Combobox(frame, textvariable=self.transition_mode_var,
-                                       values=transition_modes, width=20, state="readonly")
+                                       values=_TRANSITION_MODE_NAMES, width=20, state="readonly")
         transition_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        self._bind_widget(transition_combo, "overlay.color_transition_mode", TransitionMode.from_string)
+        self._bind_var("overlay.color_transition_mode", self.transition_mode_var, TransitionMode.from_string)
         row += 1
         
         # Ghost Parameters Section
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3, 
                                                        sticky="ew", padx=5, pady=10)
         row += 1
-        ttk.Label(frame, text="Ghost Effect Parameters", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(frame, text="Ghost Effect Parameters", font=self._bold10).grid(
             row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
         row += 1
         
         # Ghost Chance
-        ttk.Label(frame, text="Ghost Chance:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.ghost_chance_var = tk.DoubleVar(value=self.settings.overlay.ghost_chance)
-        ghost_chance_scale = ttk.Scale(frame, from_=0.0, to=1.0, orient="horizontal",
-                                      variable=self.ghost_chance_var, length=200)
-        ghost_chance_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        ghost_chance_label = ttk.Label(frame, text="")
-        ghost_chance_label.grid(row=row, column=2, sticky="w", padx=5)
-        
-        def update_ghost_chance_label(*args):
-            try:
-                value = self.ghost_chance_var.get()
-                ghost_chance_label.config(text=f"{value:.3f}")
-            except (tk.TclError, ValueError):
-                ghost_chance_label.config(text="--")
-        self.ghost_chance_var.trace_add('write', update_ghost_chance_label)
-        update_ghost_chance_label()
-        
-        self._bind_widget(ghost_chance_scale, "overlay.ghost_chance", float)
+        self.ghost_chance_var = tk.DoubleVar(value=o.ghost_chance)
+        sliders.append((row, "Ghost Chance:", self.ghost_chance_var, 0.0, 1.0, "{:.3f}"))
+        self._bind_var("overlay.ghost_chance", self.ghost_chance_var, float)
         row += 1
         
         # Ghost Decay
-        ttk.Label(frame, text="Ghost Decay:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.ghost_decay_var = tk.DoubleVar(value=self.settings.overlay.ghost_decay)
-        ghost_decay_scale = ttk.Scale(frame, from_=0.9, to=1.0, orient="horizontal",
-                                     variable=self.ghost_decay_var, length=200)
-        ghost_decay_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        ghost_decay_label = ttk.Label(frame, text="")
-        ghost_decay_label.grid(row=row, column=2, sticky="w", padx=5)
-        
-        def update_ghost_decay_label(*args):
-            try:
-                value = self.ghost_decay_var.get()
-                ghost_decay_label.config(text=f"{value:.3f}")
-            except (tk.TclError, ValueError):
-                ghost_decay_label.config(text="--")
-        self.ghost_decay_var.trace_add('write', update_ghost_decay_label)
-        update_ghost_decay_label()
-        
-        self._bind_widget(ghost_decay_scale, "overlay.ghost_decay", float)
+        self.ghost_decay_var = tk.DoubleVar(value=o.ghost_decay)
+        sliders.append((row, "Ghost Decay:", self.ghost_decay_var, 0.9, 1.0, "{:.3f}"))
+        self._bind_var("overlay.ghost_decay", self.ghost_decay_var, float)
         row += 1
         
         # Flicker Parameters Section
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3,
                                                        sticky="ew", padx=5, pady=10)
         row += 1
-        ttk.Label(frame, text="Flicker Effect Parameters", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(frame, text="Flicker Effect Parameters", font=self._bold10).grid(
             row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
         row += 1
         
         # Flicker Chance
-        ttk.Label(frame, text="Flicker Chance:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.flicker_chance_var = tk.DoubleVar(value=self.settings.overlay.flicker_chance)
-        flicker_chance_scale = ttk.Scale(frame, from_=0.0, to=0.2, orient="horizontal",
-                                        variable=self.flicker_chance_var, length=200)
-        flicker_chance_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        flicker_chance_label = ttk.Label(frame, text="")
-        flicker_chance_label.grid(row=row, column=2, sticky="w", padx=5)
-        
-        def update_flicker_chance_label(*args):
-            try:
-                value = self.flicker_chance_var.get()
-                flicker_chance_label.config(text=f"{value:.3f}")
-            except (tk.TclError, ValueError):
-                flicker_chance_label.config(text="--")
-        self.flicker_chance_var.trace_add('write', update_flicker_chance_label)
-        update_flicker_chance_label()
-        
-        self._bind_widget(flicker_chance_scale, "overlay.flicker_chance", float)
+        self.flicker_chance_var = tk.DoubleVar(value=o.flicker_chance)
+        sliders.append((row, "Flicker Chance:", self.flicker_chance_var, 0.0, 0.2, "{:.3f}"))
+        self._bind_var("overlay.flicker_chance", self.flicker_chance_var, float)
         row += 1
         
         # Color Averaging Section
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3,
                                                        sticky="ew", padx=5, pady=10)
         row += 1
-        ttk.Label(frame, text="Color Averaging (works with all transition modes)", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(frame, text="Color Averaging (works with all transition modes)", font=self._bold10).grid(
             row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
         row += 1
         
         # Enable Color Averaging
-        self.enable_color_averaging_var = tk.BooleanVar(value=self.settings.overlay.enable_color_averaging)
+        self.enable_color_averaging_var = tk.BooleanVar(value=o.enable_color_averaging)
         color_averaging_check = ttk.Checkbutton(frame, text="Enable color averaging (ghosts blend with neighbors)",
                                                variable=self.enable_color_averaging_var)
         color_averaging_check.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        self._bind_widget(color_averaging_check, "overlay.enable_color_averaging", bool)
+        self._bind_var("overlay.enable_color_averaging", self.enable_color_averaging_var, bool)
         row += 1
         
         # Color Averaging Interval
         ttk.Label(frame, text="Averaging Interval (frames):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.color_averaging_interval_var = tk.IntVar(value=self.settings.overlay.color_averaging_interval)
-        color_averaging_scale = ttk.Scale(frame, from_=10, to=180, orient="horizontal",
-                                         variable=self.color_averaging_interval_var, length=200)
-        color_averaging_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        color_averaging_label = ttk.Label(frame, text="")
+        self.color_averaging_interval_var = tk.IntVar(value=o.color_averaging_interval)
+        color_averaging_text = tk.StringVar()
+        color_averaging_label = ttk.Label(frame, textvariable=color_averaging_text)
         color_averaging_label.grid(row=row, column=2, sticky="w", padx=5)
         
         def update_color_averaging_label(*args):
-            try:
-                frames = self.color_averaging_interval_var.get()
-                seconds = frames / 60  # Assuming 60 FPS
-                color_averaging_label.config(text=f"{frames} ({seconds:.2f}s @ 60fps)")
-            except (tk.TclError, ValueError):
-                color_averaging_label.config(text="30 (0.50s @ 60fps)")
-        self.color_averaging_interval_var.trace_add('write', update_color_averaging_label)
+            # Scale-backed var always holds a number, so no TclError guard is needed
+            frames = self.color_averaging_interval_var.get()
+            color_averaging_text.set(_frame_readout(frames, _AVERAGING_READOUTS, _AVERAGING_FMT))
+        # Scale command fires only on user drags; programmatic sets refresh via _label_refreshers
+        color_averaging_scale = ttk.Scale(frame, from_=10, to=180, orient="horizontal",
+                                         variable=self.color_averaging_interval_var, length=200,
+                                         command=self._idle_debounced(update_color_averaging_label))
+        color_averaging_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        self._label_refreshers.append(update_color_averaging_label)
         update_color_averaging_label()
         
-        self._bind_widget(color_averaging_scale, "overlay.color_averaging_interval", int)
+        self._bind_var("overlay.color_averaging_interval", self.color_averaging_interval_var, int, default=30)
         row += 1
         
         ttk.Label(frame, text="Ghost colors periodically update to match average of 5x5 neighbors",
-                 font=("TkDefaultFont", 8), foreground="gray").grid(
+                 font=self._font8, foreground="gray").grid(
             row=row, column=0, columnspan=3, sticky="w", padx=5, pady=(0, 5))
         row += 1
         
+        self._create_sliders(frame, sliders)
+        
     def _create_transitions_tab(self):
         """Create the Transitions tab content."""
+        t = self.settings.transition
         # Create a canvas with scrollbar for the transitions tab
         canvas = tk.Canvas(self.transitions_frame)
         scrollbar = ttk.Scrollbar(self.transitions_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Scrolling moves the embedded frame and fires <Configure> per tick, so
+        # only touch the scroll region when the frame's size actually changes
+        scroll_size = None
+        
+        def update_scrollregion(event):
+            nonlocal scroll_size
+            size = (event.width, event.height)
+            if size != scroll_size:
+                scroll_size = size
+                canvas.configure(scrollregion=(0, 0) + size)
+        scrollable_frame.bind("<Configure>", update_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -314,83 +546,73 @@ class SettingsGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Enable mousewheel scrolling
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Enable mousewheel scrolling only while the pointer is over this canvas
+        self.transitions_canvas = canvas
+        canvas.bind("<Enter>", self._bind_mousewheel)
+        canvas.bind("<Leave>", self._on_canvas_leave)
+        canvas.bind("<Destroy>", self._unbind_mousewheel)
         
         # Now use scrollable_frame instead of frame for all content
         frame = scrollable_frame
         row = 0
         
         # Transition Speed
-        ttk.Label(frame, text="Transition Speed (px/frame):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.transition_speed_var = tk.DoubleVar(value=self.settings.transition.transition_speed)
-        transition_speed_scale = ttk.Scale(frame, from_=0.1, to=50.0, orient="horizontal",
-                                          variable=self.transition_speed_var, length=300)
-        transition_speed_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        transition_speed_label = ttk.Label(frame, text="")
-        transition_speed_label.grid(row=row, column=2, sticky="w", padx=5)
-        
-        def update_transition_speed_label(*args):
-            try:
-                value = self.transition_speed_var.get()
-                transition_speed_label.config(text=f"{value:.1f}")
-            except (tk.TclError, ValueError):
-                transition_speed_label.config(text="--")
-        self.transition_speed_var.trace_add('write', update_transition_speed_label)
-        update_transition_speed_label()
-        
-        self._bind_widget(transition_speed_scale, "transition.transition_speed", float)
+        self.transition_speed_var = tk.DoubleVar(value=t.transition_speed)
+        self._create_slider_with_label(
+            frame, row, "Transition Speed (px/frame):", self.transition_speed_var, 0.1, 50.0, "{:.1f}", length=300)
+        self._bind_var("transition.transition_speed", self.transition_speed_var, float)
         row += 1
         
         # Text Change Interval
         ttk.Label(frame, text="Text Change Interval (frames):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.text_change_interval_var = tk.IntVar(value=self.settings.transition.text_change_interval)
+        self.text_change_interval_var = tk.IntVar(value=t.text_change_interval)
         text_change_spin = ttk.Spinbox(frame, from_=60, to=18000, textvariable=self.text_change_interval_var, 
-                                      width=15)
+                                      width=15, validate='key', validatecommand=self._int_vcmd)
         text_change_spin.grid(row=row, column=1, sticky="w", padx=5, pady=5)
         
         # Show seconds equivalent
-        text_change_seconds_label = ttk.Label(frame, text="")
+        text_change_seconds_text = tk.StringVar()
+        text_change_seconds_label = ttk.Label(frame, textvariable=text_change_seconds_text)
         text_change_seconds_label.grid(row=row, column=2, sticky="w", padx=5)
         
         def update_text_change_seconds(*args):
             try:
                 frames = self.text_change_interval_var.get()
                 if frames > 0:
-                    seconds = frames / 60  # Assuming 60 FPS
-                    text_change_seconds_label.config(text=f"({seconds:.1f}s @ 60fps)")
+                    text_change_seconds_text.set(_SECONDS_FMT % (frames * _INV_60))
                 else:
-                    text_change_seconds_label.config(text="(0.0s @ 60fps)")
+                    text_change_seconds_text.set("(0.0s @ 60fps)")
             except (tk.TclError, ValueError):
-                text_change_seconds_label.config(text="(-- s @ 60fps)")
-        self.text_change_interval_var.trace_add('write', update_text_change_seconds)
+                text_change_seconds_text.set("(-- s @ 60fps)")
+        # Keystrokes are validated in Tcl; the readout follows arrow steps and finished edits
+        text_change_spin.configure(command=update_text_change_seconds)
+        text_change_spin.bind('<FocusOut>', update_text_change_seconds)
+        text_change_spin.bind('<Return>', update_text_change_seconds)
+        self._label_refreshers.append(update_text_change_seconds)
         update_text_change_seconds()
         
-        self._bind_widget(text_change_spin, "transition.text_change_interval", int)
+        self._bind_var("transition.text_change_interval", self.text_change_interval_var, int, default=1500)
         row += 1
         
         # Blank Time Between Transitions
         ttk.Label(frame, text="Blank Time Between Transitions (frames):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.blank_time_var = tk.IntVar(value=self.settings.transition.blank_time_between_transitions)
-        blank_time_scale = ttk.Scale(frame, from_=0, to=600, orient="horizontal",
-                                    variable=self.blank_time_var, length=300)
-        blank_time_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        blank_time_label = ttk.Label(frame, text="")
+        self.blank_time_var = tk.IntVar(value=t.blank_time_between_transitions)
+        blank_time_text = tk.StringVar()
+        blank_time_label = ttk.Label(frame, textvariable=blank_time_text)
         blank_time_label.grid(row=row, column=2, sticky="w", padx=5)
         
         def update_blank_time_label(*args):
-            try:
-                frames = self.blank_time_var.get()
-                seconds = frames / 60  # Assuming 60 FPS
-                blank_time_label.config(text=f"{frames} ({seconds:.1f}s @ 60fps)")
-            except (tk.TclError, ValueError):
-                blank_time_label.config(text="0 (0.0s @ 60fps)")
-        self.blank_time_var.trace_add('write', update_blank_time_label)
+            frames = self.blank_time_var.get()
+            blank_time_text.set(_frame_readout(frames, _BLANK_READOUTS, _BLANK_FMT))
+        # Scale command fires only on user drags; programmatic sets refresh via _label_refreshers
+        blank_time_scale = ttk.Scale(frame, from_=0, to=600, orient="horizontal",
+                                    variable=self.blank_time_var, length=300,
+                                    command=self._idle_debounced(update_blank_time_label))
+        blank_time_scale.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        self._label_refreshers.append(update_blank_time_label)
         update_blank_time_label()
         
-        self._bind_widget(blank_time_scale, "transition.blank_time_between_transitions", int)
+        self._bind_var("transition.blank_time_between_transitions", self.blank_time_var, int, default=0)
         row += 1
         
         # Add separator before effect transitions section
@@ -400,443 +622,120 @@ class SettingsGUI:
         
         # Effect Transitions Section Header
         ttk.Label(frame, text="Effect Transitions (change effects when text changes)", 
-                 font=("TkDefaultFont", 10, "bold")).grid(
+                 font=self._bold10).grid(
             row=row, column=0, columnspan=3, sticky="w", padx=5, pady=5)
         row += 1
         
-        # 1. COLOR SCHEME TRANSITIONS
-        color_scheme_frame = ttk.LabelFrame(frame, text="Color Scheme Transitions", padding=10)
-        color_scheme_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
-        
-        self.transition_color_scheme_var = tk.BooleanVar(value=self.settings.transition.transition_color_scheme)
-        color_scheme_check = ttk.Checkbutton(color_scheme_frame, 
-            text="Also transition color scheme when text changes",
-            variable=self.transition_color_scheme_var)
-        color_scheme_check.grid(row=0, column=0, columnspan=2, sticky="w", pady=2)
-        self._bind_widget(color_scheme_check, "transition.transition_color_scheme", bool)
-        
-        self.color_scheme_order_var = tk.StringVar(value=self.settings.transition.color_scheme_order)
-        ttk.Radiobutton(color_scheme_frame, text="Random", variable=self.color_scheme_order_var, 
-                       value="random").grid(row=1, column=0, sticky="w", padx=20)
-        ttk.Radiobutton(color_scheme_frame, text="Sequential", variable=self.color_scheme_order_var,
-                       value="sequential").grid(row=1, column=1, sticky="w")
-        self._bind_widget(color_scheme_frame, "transition.color_scheme_order", str)
-        
-        ttk.Label(color_scheme_frame, text="Cycles through all 23 available color schemes",
-                 font=("TkDefaultFont", 8)).grid(row=2, column=0, columnspan=2, sticky="w", pady=2)
-        
-        # 2. TRANSITION MODE TRANSITIONS
-        color_mode_frame = ttk.LabelFrame(frame, text="Transition Mode Transitions", padding=10)
-        color_mode_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
-        
-        self.transition_color_mode_var = tk.BooleanVar(value=self.settings.transition.transition_color_mode)
-        color_mode_check = ttk.Checkbutton(color_mode_frame,
-            text="Also transition color transition mode when text changes",
-            variable=self.transition_color_mode_var)
-        color_mode_check.grid(row=0, column=0, columnspan=2, sticky="w", pady=2)
-        self._bind_widget(color_mode_check, "transition.transition_color_mode", bool)
-        
-        self.color_mode_order_var = tk.StringVar(value=self.settings.transition.color_mode_order)
-        ttk.Radiobutton(color_mode_frame, text="Random", variable=self.color_mode_order_var,
-                       value="random").grid(row=1, column=0, sticky="w", padx=20)
-        ttk.Radiobutton(color_mode_frame, text="Sequential", variable=self.color_mode_order_var,
-                       value="sequential").grid(row=1, column=1, sticky="w")
-        self._bind_widget(color_mode_frame, "transition.color_mode_order", str)
-        
-        ttk.Label(color_mode_frame, text="Cycles through: smooth, snap, mixed, spread_horizontal, spread_vertical",
-                 font=("TkDefaultFont", 8)).grid(row=2, column=0, columnspan=2, sticky="w", pady=2)
-        
-        # 3. GHOST EFFECT TRANSITIONS
-        ghost_frame = ttk.LabelFrame(frame, text="Ghost Effect Transitions", padding=10)
-        ghost_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
-        
-        self.transition_ghost_params_var = tk.BooleanVar(value=self.settings.transition.transition_ghost_params)
-        ghost_check = ttk.Checkbutton(ghost_frame,
-            text="Also transition ghost effects when text changes",
-            variable=self.transition_ghost_params_var)
-        ghost_check.grid(row=0, column=0, columnspan=3, sticky="w", pady=2)
-        self._bind_widget(ghost_check, "transition.transition_ghost_params", bool)
-        
-        self.ghost_params_order_var = tk.StringVar(value=self.settings.transition.ghost_params_order)
-        ttk.Radiobutton(ghost_frame, text="Random", variable=self.ghost_params_order_var,
-                       value="random").grid(row=1, column=0, sticky="w", padx=20)
-        ttk.Radiobutton(ghost_frame, text="Sequential", variable=self.ghost_params_order_var,
-                       value="sequential").grid(row=1, column=1, sticky="w")
-        self._bind_widget(ghost_frame, "transition.ghost_params_order", str)
-        
-        # Ghost Chance Min/Max
-        ttk.Label(ghost_frame, text="Ghost Chance Min:").grid(row=2, column=0, sticky="w", padx=20, pady=2)
-        self.ghost_chance_min_var = tk.DoubleVar(value=self.settings.transition.ghost_chance_min)
-        ghost_chance_min_scale = ttk.Scale(ghost_frame, from_=0.0, to=1.0, orient="horizontal",
-                                          variable=self.ghost_chance_min_var, length=200)
-        ghost_chance_min_scale.grid(row=2, column=1, sticky="w", pady=2)
-        ghost_chance_min_label = ttk.Label(ghost_frame, text="")
-        ghost_chance_min_label.grid(row=2, column=2, sticky="w", padx=5)
-        
-        def update_ghost_chance_min(*args):
-            ghost_chance_min_label.config(text=f"{self.ghost_chance_min_var.get():.3f}")
-        self.ghost_chance_min_var.trace_add('write', update_ghost_chance_min)
-        update_ghost_chance_min()
-        self._bind_widget(ghost_chance_min_scale, "transition.ghost_chance_min", float)
-        
-        ttk.Label(ghost_frame, text="Ghost Chance Max:").grid(row=3, column=0, sticky="w", padx=20, pady=2)
-        self.ghost_chance_max_var = tk.DoubleVar(value=self.settings.transition.ghost_chance_max)
-        ghost_chance_max_scale = ttk.Scale(ghost_frame, from_=0.0, to=1.0, orient="horizontal",
-                                          variable=self.ghost_chance_max_var, length=200)
-        ghost_chance_max_scale.grid(row=3, column=1, sticky="w", pady=2)
-        ghost_chance_max_label = ttk.Label(ghost_frame, text="")
-        ghost_chance_max_label.grid(row=3, column=2, sticky="w", padx=5)
-        
-        def update_ghost_chance_max(*args):
-            ghost_chance_max_label.config(text=f"{self.ghost_chance_max_var.get():.3f}")
-        self.ghost_chance_max_var.trace_add('write', update_ghost_chance_max)
-        update_ghost_chance_max()
-        self._bind_widget(ghost_chance_max_scale, "transition.ghost_chance_max", float)
-        
-        # Ghost Decay Min/Max
-        ttk.Label(ghost_frame, text="Ghost Decay Min:").grid(row=4, column=0, sticky="w", padx=20, pady=2)
-        self.ghost_decay_min_var = tk.DoubleVar(value=self.settings.transition.ghost_decay_min)
-        ghost_decay_min_scale = ttk.Scale(ghost_frame, from_=0.9, to=1.0, orient="horizontal",
-                                         variable=self.ghost_decay_min_var, length=200)
-        ghost_decay_min_scale.grid(row=4, column=1, sticky="w", pady=2)
-        ghost_decay_min_label = ttk.Label(ghost_frame, text="")
-        ghost_decay_min_label.grid(row=4, column=2, sticky="w", padx=5)
-        
-        def update_ghost_decay_min(*args):
-            ghost_decay_min_label.config(text=f"{self.ghost_decay_min_var.get():.4f}")
-        self.ghost_decay_min_var.trace_add('write', update_ghost_decay_min)
-        update_ghost_decay_min()
-        self._bind_widget(ghost_decay_min_scale, "transition.ghost_decay_min", float)
-        
-        ttk.Label(ghost_frame, text="Ghost Decay Max:").grid(row=5, column=0, sticky="w", padx=20, pady=2)
-        self.ghost_decay_max_var = tk.DoubleVar(value=self.settings.transition.ghost_decay_max)
-        ghost_decay_max_scale = ttk.Scale(ghost_frame, from_=0.9, to=1.0, orient="horizontal",
-                                         variable=self.ghost_decay_max_var, length=200)
-        ghost_decay_max_scale.grid(row=5, column=1, sticky="w", pady=2)
-        ghost_decay_max_label = ttk.Label(ghost_frame, text="")
-        ghost_decay_max_label.grid(row=5, column=2, sticky="w", padx=5)
-        
-        def update_ghost_decay_max(*args):
-            ghost_decay_max_label.config(text=f"{self.ghost_decay_max_var.get():.4f}")
-        self.ghost_decay_max_var.trace_add('write', update_ghost_decay_max)
-        update_ghost_decay_max()
-        self._bind_widget(ghost_decay_max_scale, "transition.ghost_decay_max", float)
-        
-        ttk.Label(ghost_frame, text="Randomizes ghost parameters within specified ranges",
-                 font=("TkDefaultFont", 8)).grid(row=6, column=0, columnspan=3, sticky="w", pady=2)
-        
-        # 4. FLICKER EFFECT TRANSITIONS
-        flicker_frame = ttk.LabelFrame(frame, text="Flicker Effect Transitions", padding=10)
-        flicker_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
-        
-        self.transition_flicker_params_var = tk.BooleanVar(value=self.settings.transition.transition_flicker_params)
-        flicker_check = ttk.Checkbutton(flicker_frame,
-            text="Also transition flicker effects when text changes",
-            variable=self.transition_flicker_params_var)
-        flicker_check.grid(row=0, column=0, columnspan=3, sticky="w", pady=2)
-        self._bind_widget(flicker_check, "transition.transition_flicker_params", bool)
-        
-        self.flicker_params_order_var = tk.StringVar(value=self.settings.transition.flicker_params_order)
-        ttk.Radiobutton(flicker_frame, text="Random", variable=self.flicker_params_order_var,
-                       value="random").grid(row=1, column=0, sticky="w", padx=20)
-        ttk.Radiobutton(flicker_frame, text="Sequential", variable=self.flicker_params_order_var,
-                       value="sequential").grid(row=1, column=1, sticky="w")
-        self._bind_widget(flicker_frame, "transition.flicker_params_order", str)
-        
-        # Flicker Chance Min/Max
-        ttk.Label(flicker_frame, text="Flicker Chance Min:").grid(row=2, column=0, sticky="w", padx=20, pady=2)
-        self.flicker_chance_min_var = tk.DoubleVar(value=self.settings.transition.flicker_chance_min)
-        flicker_chance_min_scale = ttk.Scale(flicker_frame, from_=0.0, to=0.2, orient="horizontal",
-                                            variable=self.flicker_chance_min_var, length=200)
-        flicker_chance_min_scale.grid(row=2, column=1, sticky="w", pady=2)
-        flicker_chance_min_label = ttk.Label(flicker_frame, text="")
-        flicker_chance_min_label.grid(row=2, column=2, sticky="w", padx=5)
-        
-        def update_flicker_chance_min(*args):
-            flicker_chance_min_label.config(text=f"{self.flicker_chance_min_var.get():.3f}")
-        self.flicker_chance_min_var.trace_add('write', update_flicker_chance_min)
-        update_flicker_chance_min()
-        self._bind_widget(flicker_chance_min_scale, "transition.flicker_chance_min", float)
-        
-        ttk.Label(flicker_frame, text="Flicker Chance Max:").grid(row=3, column=0, sticky="w", padx=20, pady=2)
-        self.flicker_chance_max_var = tk.DoubleVar(value=self.settings.transition.flicker_chance_max)
-        flicker_chance_max_scale = ttk.Scale(flicker_frame, from_=0.0, to=0.2, orient="horizontal",
-                                            variable=self.flicker_chance_max_var, length=200)
-        flicker_chance_max_scale.grid(row=3, column=1, sticky="w", pady=2)
-        flicker_chance_max_label = ttk.Label(flicker_frame, text="")
-        flicker_chance_max_label.grid(row=3, column=2, sticky="w", padx=5)
-        
-        def update_flicker_chance_max(*args):
-            flicker_chance_max_label.config(text=f"{self.flicker_chance_max_var.get():.3f}")
-        self.flicker_chance_max_var.trace_add('write', update_flicker_chance_max)
-        update_flicker_chance_max()
-        self._bind_widget(flicker_chance_max_scale, "transition.flicker_chance_max", float)
-        
-        # Flicker Intensity Min/Max
-        ttk.Label(flicker_frame, text="Flicker Intensity Min:").grid(row=4, column=0, sticky="w", padx=20, pady=2)
-        self.flicker_intensity_min_var = tk.DoubleVar(value=self.settings.transition.flicker_intensity_min)
-        flicker_intensity_min_scale = ttk.Scale(flicker_frame, from_=0.0, to=1.0, orient="horizontal",
-                                               variable=self.flicker_intensity_min_var, length=200)
-        flicker_intensity_min_scale.grid(row=4, column=1, sticky="w", pady=2)
-        flicker_intensity_min_label = ttk.Label(flicker_frame, text="")
-        flicker_intensity_min_label.grid(row=4, column=2, sticky="w", padx=5)
-        
-        def update_flicker_intensity_min(*args):
-            flicker_intensity_min_label.config(text=f"{self.flicker_intensity_min_var.get():.3f}")
-        self.flicker_intensity_min_var.trace_add('write', update_flicker_intensity_min)
-        update_flicker_intensity_min()
-        self._bind_widget(flicker_intensity_min_scale, "transition.flicker_intensity_min", float)
-        
-        ttk.Label(flicker_frame, text="Flicker Intensity Max:").grid(row=5, column=0, sticky="w", padx=20, pady=2)
-        self.flicker_intensity_max_var = tk.DoubleVar(value=self.settings.transition.flicker_intensity_max)
-        flicker_intensity_max_scale = ttk.Scale(flicker_frame, from_=0.0, to=1.0, orient="horizontal",
-                                               variable=self.flicker_intensity_max_var, length=200)
-        flicker_intensity_max_scale.grid(row=5, column=1, sticky="w", pady=2)
-        flicker_intensity_max_label = ttk.Label(flicker_frame, text="")
-        flicker_intensity_max_label.grid(row=5, column=2, sticky="w", padx=5)
-        
-        def update_flicker_intensity_max(*args):
-            flicker_intensity_max_label.config(text=f"{self.flicker_intensity_max_var.get():.3f}")
-        self.flicker_intensity_max_var.trace_add('write', update_flicker_intensity_max)
-        update_flicker_intensity_max()
-        self._bind_widget(flicker_intensity_max_scale, "transition.flicker_intensity_max", float)
-        
-        ttk.Label(flicker_frame, text="Randomizes flicker parameters within specified ranges",
-                 font=("TkDefaultFont", 8)).grid(row=6, column=0, columnspan=3, sticky="w", pady=2)
-        
-        # 5. SPEED VARIATION
-        speed_frame = ttk.LabelFrame(frame, text="Speed Variation", padding=10)
-        speed_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
-        
-        self.transition_speed_variation_var = tk.BooleanVar(value=self.settings.transition.transition_speed_variation)
-        speed_variation_check = ttk.Checkbutton(speed_frame,
-            text="Also vary transition speed when text changes",
-            variable=self.transition_speed_variation_var)
-        speed_variation_check.grid(row=0, column=0, columnspan=3, sticky="w", pady=2)
-        self._bind_widget(speed_variation_check, "transition.transition_speed_variation", bool)
-        
-        self.speed_order_var = tk.StringVar(value=self.settings.transition.speed_order)
-        ttk.Radiobutton(speed_frame, text="Random", variable=self.speed_order_var,
-                       value="random").grid(row=1, column=0, sticky="w", padx=20)
-        ttk.Radiobutton(speed_frame, text="Sequential", variable=self.speed_order_var,
-                       value="sequential").grid(row=1, column=1, sticky="w")
-        self._bind_widget(speed_frame, "transition.speed_order", str)
-        
-        # Speed Min/Max
-        ttk.Label(speed_frame, text="Speed Min (px/frame):").grid(row=2, column=0, sticky="w", padx=20, pady=2)
-        self.speed_min_var = tk.DoubleVar(value=self.settings.transition.speed_min)
-        speed_min_scale = ttk.Scale(speed_frame, from_=0.1, to=50.0, orient="horizontal",
-                                   variable=self.speed_min_var, length=200)
-        speed_min_scale.grid(row=2, column=1, sticky="w", pady=2)
-        speed_min_label = ttk.Label(speed_frame, text="")
-        speed_min_label.grid(row=2, column=2, sticky="w", padx=5)
-        
-        def update_speed_min(*args):
-            speed_min_label.config(text=f"{self.speed_min_var.get():.1f}")
-        self.speed_min_var.trace_add('write', update_speed_min)
-        update_speed_min()
-        self._bind_widget(speed_min_scale, "transition.speed_min", float)
-        
-        ttk.Label(speed_frame, text="Speed Max (px/frame):").grid(row=3, column=0, sticky="w", padx=20, pady=2)
-        self.speed_max_var = tk.DoubleVar(value=self.settings.transition.speed_max)
-        speed_max_scale = ttk.Scale(speed_frame, from_=0.1, to=50.0, orient="horizontal",
-                                   variable=self.speed_max_var, length=200)
-        speed_max_scale.grid(row=3, column=1, sticky="w", pady=2)
-        speed_max_label = ttk.Label(speed_frame, text="")
-        speed_max_label.grid(row=3, column=2, sticky="w", padx=5)
-        
-        def update_speed_max(*args):
-            speed_max_label.config(text=f"{self.speed_max_var.get():.1f}")
-        self.speed_max_var.trace_add('write', update_speed_max)
-        update_speed_max()
-        self._bind_widget(speed_max_scale, "transition.speed_max", float)
-        
-        ttk.Label(speed_frame, text="Randomizes transition speed within specified range",
-                 font=("TkDefaultFont", 8)).grid(row=4, column=0, columnspan=3, sticky="w", pady=2)
+        for title, check_text, check_attr, order_attr, sliders, hint in self._EFFECT_TRANSITION_SECTIONS:
+            section = ttk.LabelFrame(frame, text=title, padding=10)
+            section.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
+            row += 1
+            span = 3 if sliders else 2
+            
+            check_var = tk.BooleanVar(value=getattr(t, check_attr[:-4]))
+            setattr(self, check_attr, check_var)
+            ttk.Checkbutton(section, text=check_text, variable=check_var).grid(
+                row=0, column=0, columnspan=span, sticky="w", pady=2)
+            self._bind_var("transition." + check_attr[:-4], check_var, bool)
+            
+            order_var = tk.StringVar(value=getattr(t, order_attr[:-4]))
+            setattr(self, order_attr, order_var)
+            _radio_pair(section, order_var, 1)
+            self._bind_var("transition." + order_attr[:-4], order_var, str)
+            
+            # Range sliders share their vars with the Advanced tab
+            self._create_sliders(section, (
+                (slider_row, label, getattr(self.shared, var_name), from_, to, fmt)
+                for slider_row, (label, var_name, from_, to, fmt) in enumerate(sliders, start=2)
+            ), label_padx=20, slider_padx=0, pady=2)
+            
+            ttk.Label(section, text=hint, font=self._font8).grid(
+                row=2 + len(sliders), column=0, columnspan=span, sticky="w", pady=2)
         
+    def _bind_mousewheel(self, event=None):
+        """Route wheel events (Windows/macOS delta and X11 buttons 4/5) to the Transitions canvas."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(sequence, self._on_mousewheel)
+    
+    def _on_canvas_leave(self, event=None):
+        """Unbind the wheel unless the pointer only moved onto a widget inside the canvas."""
+        hovered = self.root.winfo_containing(*self.root.winfo_pointerxy())
+        if hovered is None or not str(hovered).startswith(str(self.transitions_canvas)):
+            self._unbind_mousewheel()
+    
+    def _unbind_mousewheel(self, event=None):
+        """Stop routing wheel events once the pointer leaves the Transitions canvas."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.unbind_all(sequence)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the Transitions canvas by wheel units."""
+        self.transitions_canvas.yview_scroll(_wheel_units(event), "units")
+    
     def _create_advanced_tab(self):
         """Create the Advanced tab content."""
         frame = self.advanced_frame
-        row = 0
-        
-        # File Monitoring Section
-        ttk.Label(frame, text="File Monitoring", font=("TkDefaultFont", 10, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        row += 1
         
         # File Check Interval
-        ttk.Label(frame, text="File Check Interval (frames):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.file_check_interval_var = tk.IntVar(value=self.settings.file_monitoring.file_check_interval)
-        file_check_spin = ttk.Spinbox(frame, from_=30, to=1800, textvariable=self.file_check_interval_var,
-                                     width=15)
-        file_check_spin.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        self._bind_widget(file_check_spin, "file_monitoring.file_check_interval", int)
-        row += 1
-        
-        # Debug Section
-        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3,
-                                                       sticky="ew", padx=5, pady=10)
-        row += 1
-        ttk.Label(frame, text="Debug Settings", font=("TkDefaultFont", 10, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        row += 1
+        self.file_check_spin = ttk.Spinbox(frame, from_=30, to=1800, width=15,
+                                           validate='focusout', validatecommand=self._int_vcmd)
+        self.file_check_spin.insert(0, str(self.settings.file_monitoring.file_check_interval))
+        self._bind_spinbox(self.file_check_spin, "file_monitoring.file_check_interval", int, default=60,
+                           restore_invalid=True)
         
         # Debug Output Interval
-        ttk.Label(frame, text="Debug Output Interval (frames):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.debug_interval_var = tk.IntVar(value=self.settings.debug.debug_output_interval)
-        debug_spin = ttk.Spinbox(frame, from_=60, to=3600, textvariable=self.debug_interval_var, width=15)
-        debug_spin.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        self._bind_widget(debug_spin, "debug.debug_output_interval", int)
-        row += 1
+        self.debug_spin = ttk.Spinbox(frame, from_=60, to=3600, width=15,
+                                      validate='focusout', validatecommand=self._int_vcmd)
+        self.debug_spin.insert(0, str(self.settings.debug.debug_output_interval))
+        self._bind_spinbox(self.debug_spin, "debug.debug_output_interval", int, default=300,
+                           restore_invalid=True)
         
         # Effect Transition Ranges Section
-        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=3,
-                                                       sticky="ew", padx=5, pady=10)
-        row += 1
-        
         effect_ranges_frame = ttk.LabelFrame(frame, text="Effect Transition Parameter Ranges", padding=10)
-        effect_ranges_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
-        row += 1
+        
+        self._grid_many((
+            # File Monitoring Section
+            (ttk.Label(frame, text="File Monitoring", font=self._bold10), 0, 0, {'columnspan': 2}),
+            (ttk.Label(frame, text="File Check Interval (frames):"), 1, 0, {}),
+            (self.file_check_spin, 1, 1, {}),
+            # Debug Section
+            (ttk.Separator(frame, orient="horizontal"), 2, 0, {'columnspan': 3, 'sticky': "ew", 'pady': 10}),
+            (ttk.Label(frame, text="Debug Settings", font=self._bold10), 3, 0, {'columnspan': 2}),
+            (ttk.Label(frame, text="Debug Output Interval (frames):"), 4, 0, {}),
+            (self.debug_spin, 4, 1, {}),
+            (ttk.Separator(frame, orient="horizontal"), 5, 0, {'columnspan': 3, 'sticky': "ew", 'pady': 10}),
+            (effect_ranges_frame, 6, 0, {'columnspan': 3, 'sticky': "ew"}),
+        ))
         
         ttk.Label(effect_ranges_frame, text="Configure min/max bounds for random effect transitions",
-                 font=("TkDefaultFont", 9)).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
+                 font=self._font9).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
         
-        # Speed variation ranges
-        ttk.Label(effect_ranges_frame, text="Speed Variation", font=("TkDefaultFont", 9, "bold")).grid(
-            row=1, column=0, columnspan=3, sticky="w", pady=(5, 2))
+        # Range sliders are created the first time the frame is actually mapped
+        self.effect_ranges_frame = effect_ranges_frame
+        self._ranges_built = False
+        self._ranges_map_binding = effect_ranges_frame.bind('<Map>', self._build_ranges_once)
         
-        ttk.Label(effect_ranges_frame, text="Speed Min (px/frame):").grid(row=2, column=0, sticky="w", padx=20, pady=2)
-        speed_min_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.1, to=50.0, orient="horizontal",
-                                        variable=self.speed_min_var, length=200)
-        speed_min_adv_scale.grid(row=2, column=1, sticky="w", pady=2)
-        speed_min_adv_label = ttk.Label(effect_ranges_frame, text="")
-        speed_min_adv_label.grid(row=2, column=2, sticky="w", padx=5)
-        
-        def update_speed_min_adv(*args):
-            speed_min_adv_label.config(text=f"{self.speed_min_var.get():.1f}")
-        self.speed_min_var.trace_add('write', update_speed_min_adv)
-        update_speed_min_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Speed Max (px/frame):").grid(row=3, column=0, sticky="w", padx=20, pady=2)
-        speed_max_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.1, to=50.0, orient="horizontal",
-                                        variable=self.speed_max_var, length=200)
-        speed_max_adv_scale.grid(row=3, column=1, sticky="w", pady=2)
-        speed_max_adv_label = ttk.Label(effect_ranges_frame, text="")
-        speed_max_adv_label.grid(row=3, column=2, sticky="w", padx=5)
-        
-        def update_speed_max_adv(*args):
-            speed_max_adv_label.config(text=f"{self.speed_max_var.get():.1f}")
-        self.speed_max_var.trace_add('write', update_speed_max_adv)
-        update_speed_max_adv()
-        
-        # Ghost parameter ranges
-        ttk.Label(effect_ranges_frame, text="Ghost Parameters", font=("TkDefaultFont", 9, "bold")).grid(
-            row=4, column=0, columnspan=3, sticky="w", pady=(10, 2))
+    def _build_ranges_once(self, event=None):
+        """Populate the Effect Transition Parameter Ranges frame on its first <Map>."""
+        if self._ranges_built:
+            return
+        self._ranges_built = True
+        effect_ranges_frame = self.effect_ranges_frame
+        effect_ranges_frame.unbind('<Map>', self._ranges_map_binding)
         
-        ttk.Label(effect_ranges_frame, text="Ghost Chance Min:").grid(row=5, column=0, sticky="w", padx=20, pady=2)
-        ghost_chance_min_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=1.0, orient="horizontal",
-                                               variable=self.ghost_chance_min_var, length=200)
-        ghost_chance_min_adv_scale.grid(row=5, column=1, sticky="w", pady=2)
-        ghost_chance_min_adv_label = ttk.Label(effect_ranges_frame, text="")
-        ghost_chance_min_adv_label.grid(row=5, column=2, sticky="w", padx=5)
-        
-        def update_ghost_chance_min_adv(*args):
-            ghost_chance_min_adv_label.config(text=f"{self.ghost_chance_min_var.get():.3f}")
-        self.ghost_chance_min_var.trace_add('write', update_ghost_chance_min_adv)
-        update_ghost_chance_min_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Ghost Chance Max:").grid(row=6, column=0, sticky="w", padx=20, pady=2)
-        ghost_chance_max_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=1.0, orient="horizontal",
-                                               variable=self.ghost_chance_max_var, length=200)
-        ghost_chance_max_adv_scale.grid(row=6, column=1, sticky="w", pady=2)
-        ghost_chance_max_adv_label = ttk.Label(effect_ranges_frame, text="")
-        ghost_chance_max_adv_label.grid(row=6, column=2, sticky="w", padx=5)
-        
-        def update_ghost_chance_max_adv(*args):
-            ghost_chance_max_adv_label.config(text=f"{self.ghost_chance_max_var.get():.3f}")
-        self.ghost_chance_max_var.trace_add('write', update_ghost_chance_max_adv)
-        update_ghost_chance_max_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Ghost Decay Min:").grid(row=7, column=0, sticky="w", padx=20, pady=2)
-        ghost_decay_min_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.9, to=1.0, orient="horizontal",
-                                              variable=self.ghost_decay_min_var, length=200)
-        ghost_decay_min_adv_scale.grid(row=7, column=1, sticky="w", pady=2)
-        ghost_decay_min_adv_label = ttk.Label(effect_ranges_frame, text="")
-        ghost_decay_min_adv_label.grid(row=7, column=2, sticky="w", padx=5)
-        
-        def update_ghost_decay_min_adv(*args):
-            ghost_decay_min_adv_label.config(text=f"{self.ghost_decay_min_var.get():.4f}")
-        self.ghost_decay_min_var.trace_add('write', update_ghost_decay_min_adv)
-        update_ghost_decay_min_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Ghost Decay Max:").grid(row=8, column=0, sticky="w", padx=20, pady=2)
-        ghost_decay_max_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.9, to=1.0, orient="horizontal",
-                                              variable=self.ghost_decay_max_var, length=200)
-        ghost_decay_max_adv_scale.grid(row=8, column=1, sticky="w", pady=2)
-        ghost_decay_max_adv_label = ttk.Label(effect_ranges_frame, text="")
-        ghost_decay_max_adv_label.grid(row=8, column=2, sticky="w", padx=5)
-        
-        def update_ghost_decay_max_adv(*args):
-            ghost_decay_max_adv_label.config(text=f"{self.ghost_decay_max_var.get():.4f}")
-        self.ghost_decay_max_var.trace_add('write', update_ghost_decay_max_adv)
-        update_ghost_decay_max_adv()
-        
-        # Flicker parameter ranges
-        ttk.Label(effect_ranges_frame, text="Flicker Parameters", font=("TkDefaultFont", 9, "bold")).grid(
+        # Section headers; the sliders below fill the rows between them
+        ttk.Label(effect_ranges_frame, text="Speed Variation", font=self._bold9).grid(
+            row=1, column=0, columnspan=3, sticky="w", pady=(5, 2))
+        ttk.Label(effect_ranges_frame, text="Ghost Parameters", font=self._bold9).grid(
+            row=4, column=0, columnspan=3, sticky="w", pady=(10, 2))
+        ttk.Label(effect_ranges_frame, text="Flicker Parameters", font=self._bold9).grid(
             row=9, column=0, columnspan=3, sticky="w", pady=(10, 2))
         
-        ttk.Label(effect_ranges_frame, text="Flicker Chance Min:").grid(row=10, column=0, sticky="w", padx=20, pady=2)
-        flicker_chance_min_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=0.2, orient="horizontal",
-                                                 variable=self.flicker_chance_min_var, length=200)
-        flicker_chance_min_adv_scale.grid(row=10, column=1, sticky="w", pady=2)
-        flicker_chance_min_adv_label = ttk.Label(effect_ranges_frame, text="")
-        flicker_chance_min_adv_label.grid(row=10, column=2, sticky="w", padx=5)
-        
-        def update_flicker_chance_min_adv(*args):
-            flicker_chance_min_adv_label.config(text=f"{self.flicker_chance_min_var.get():.3f}")
-        self.flicker_chance_min_var.trace_add('write', update_flicker_chance_min_adv)
-        update_flicker_chance_min_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Flicker Chance Max:").grid(row=11, column=0, sticky="w", padx=20, pady=2)
-        flicker_chance_max_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=0.2, orient="horizontal",
-                                                 variable=self.flicker_chance_max_var, length=200)
-        flicker_chance_max_adv_scale.grid(row=11, column=1, sticky="w", pady=2)
-        flicker_chance_max_adv_label = ttk.Label(effect_ranges_frame, text="")
-        flicker_chance_max_adv_label.grid(row=11, column=2, sticky="w", padx=5)
-        
-        def update_flicker_chance_max_adv(*args):
-            flicker_chance_max_adv_label.config(text=f"{self.flicker_chance_max_var.get():.3f}")
-        self.flicker_chance_max_var.trace_add('write', update_flicker_chance_max_adv)
-        update_flicker_chance_max_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Flicker Intensity Min:").grid(row=12, column=0, sticky="w", padx=20, pady=2)
-        flicker_intensity_min_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=1.0, orient="horizontal",
-                                                    variable=self.flicker_intensity_min_var, length=200)
-        flicker_intensity_min_adv_scale.grid(row=12, column=1, sticky="w", pady=2)
-        flicker_intensity_min_adv_label = ttk.Label(effect_ranges_frame, text="")
-        flicker_intensity_min_adv_label.grid(row=12, column=2, sticky="w", padx=5)
-        
-        def update_flicker_intensity_min_adv(*args):
-            flicker_intensity_min_adv_label.config(text=f"{self.flicker_intensity_min_var.get():.3f}")
-        self.flicker_intensity_min_var.trace_add('write', update_flicker_intensity_min_adv)
-        update_flicker_intensity_min_adv()
-        
-        ttk.Label(effect_ranges_frame, text="Flicker Intensity Max:").grid(row=13, column=0, sticky="w", padx=20, pady=2)
-        flicker_intensity_max_adv_scale = ttk.Scale(effect_ranges_frame, from_=0.0, to=1.0, orient="horizontal",
-                                                    variable=self.flicker_intensity_max_var, length=200)
-        flicker_intensity_max_adv_scale.grid(row=13, column=1, sticky="w", pady=2)
-        flicker_intensity_max_adv_label = ttk.Label(effect_ranges_frame, text="")
-        flicker_intensity_max_adv_label.grid(row=13, column=2, sticky="w", padx=5)
-        
-        def update_flicker_intensity_max_adv(*args):
-            flicker_intensity_max_adv_label.config(text=f"{self.flicker_intensity_max_var.get():.3f}")
-        self.flicker_intensity_max_var.trace_add('write', update_flicker_intensity_max_adv)
-        update_flicker_intensity_max_adv()
+        shared = self.shared
+        self._create_sliders(effect_ranges_frame, (
+            (row, label_text, getattr(shared, var_name), from_, to, format_str)
+            for row, label_text, var_name, from_, to, format_str in self._ADVANCED_SLIDER_SPECS
+        ), label_padx=20, slider_padx=0, pady=2)
         
     def _create_control_buttons(self):
         """Create control buttons at the bottom of the window."""
@@ -850,356 +749,557 @@ class SettingsGUI:
         button_frame = ttk.Frame(self.root)
         button_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 5))
         
-        # Preset buttons
-        ttk.Button(button_frame, text="Demo Settings", 
-                  command=self._load_demo_settings).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Transgender Pride", 
-                  command=self._load_transgender_settings).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="Performance", 
-                  command=self._load_performance_settings).pack(side="left", padx=5)
+        # Preset buttons: button text -> (settings factory, status label)
+        self._presets: Dict[str, Tuple[Callable[[], Settings], str]] = {
+            "Demo Settings": (create_demo_settings, "Demo"),
+            "Transgender Pride": (create_transgender_pride_settings, "Transgender pride"),
+            "Performance": (create_performance_settings, "Performance"),
+        }
+        for name in self._presets:
+            ttk.Button(button_frame, text=name,
+                      command=lambda name=name: self._load_preset(name)).pack(side="left", padx=5)
         
         # Save button
         ttk.Button(button_frame, text="Save Settings", 
                   command=self._save_current_settings).pack(side="right", padx=5)
         
-    def _bind_widget(self, widget, settings_path: str, converter: Callable):
-        """Bind a widget to a settings path for manual saving."""
-        self.widget_bindings[widget] = (settings_path, converter)
-        
-    def _update_setting_from_widget(self, widget):
-        """Update settings object when widget value changes."""
-        if widget not in self.widget_bindings:
-            return
-            
-        settings_path, converter = self.widget_bindings[widget]
+    def _create_sliders(self, parent, specs, **options):
+        """Create sliders from (row, label, variable, from, to, format) specs in one pass.
+        
+        Options (length, paddings) apply to every slider, as in _create_slider_with_label.
+        """
+        create = self._create_slider_with_label
+        for row, label_text, variable, from_, to, format_str in specs:
+            create(parent, row, label_text, variable, from_, to, format_str, **options)
+        
+    def _create_slider_with_label(self, parent, row: int, label_text: str, variable: tk.Variable,
+                                  from_: float, to: float, format_str: str = "{:.3f}", length: int = 200,
+                                  label_padx: int = 5, slider_padx: int = 5, pady: int = 5) -> ttk.Scale:
+        """Create a label, horizontal slider and live value readout on one grid row.
+        
+        The readout is driven by the slider's command callback, which only fires
+        on user interaction and carries the new value, so programmatic set()
+        calls cost nothing; _refresh_slider_labels resyncs after bulk updates.
+        Refreshes are coalesced through after_idle, and every readout sharing
+        the variable is updated together.
+        """
+        ttk.Label(parent, text=label_text).grid(row=row, column=0, sticky="w", padx=label_padx, pady=pady)
+        text_var = tk.StringVar()  # Writing the Tcl variable skips config()'s option parsing
+        fmt = _FORMATTERS.get(format_str) or format_str.format
+        # Fixed width for the widest readout in range, so changing values never re-lay out the row
+        value_label = ttk.Label(parent, textvariable=text_var,
+                                width=max(len(fmt(from_)), len(fmt(to)), len("--")))
+        set_text = text_var.set
+        
+        def set_label(value):
+            try:
+                set_text(fmt(float(value)))
+            except (TypeError, ValueError):
+                set_text("--")
+        
+        setters = self._slider_labels.setdefault(str(variable), (variable, []))[1]
+        setters.append(set_label)
+        pending = None
+        
+        def flush():
+            nonlocal pending
+            value, pending = pending, None
+            for setter in setters:
+                setter(value)
+        
+        def on_slide(value):
+            nonlocal pending
+            if pending is None:
+                self.root.after_idle(flush)
+            pending = value
+        
+        slider = ttk.Scale(parent, from_=from_, to=to, orient="horizontal",
+                           variable=variable, length=length, command=on_slide)
+        slider.grid(row=row, column=1, sticky="w", padx=slider_padx, pady=pady)
+        value_label.grid(row=row, column=2, sticky="w", padx=5)
         
         try:
-            # Get value directly from the associated variable, not the widget
-            if settings_path == "transition.shuffle_text_order":
-                value = self.shuffle_text_order_var.get()
-            elif settings_path == "overlay.overlay_enabled":
-                value = self.overlay_enabled_var.get()
-            elif settings_path == "overlay.color_scheme":
-                value = self.color_scheme_var.get()
-            elif settings_path == "overlay.color_transition_mode":
-                value = self.transition_mode_var.get()
-            elif settings_path == "overlay.ghost_chance":
-                value = self.ghost_chance_var.get()
-            elif settings_path == "overlay.ghost_decay":
-                value = self.ghost_decay_var.get()
-            elif settings_path == "overlay.flicker_chance":
-                value = self.flicker_chance_var.get()
-            elif settings_path == "overlay.enable_color_averaging":
-                value = self.enable_color_averaging_var.get()
-            elif settings_path == "overlay.color_averaging_interval":
-                try:
-                    value = self.color_averaging_interval_var.get()
-                    if value <= 0:
-                        value = 30  # Default fallback
-                except (tk.TclError, ValueError):
-                    value = 30  # Default fallback
-            elif settings_path == "transition.transition_speed":
-                value = self.transition_speed_var.get()
-            elif settings_path == "transition.text_change_interval":
-                try:
-                    value = self.text_change_interval_var.get()
-                    if value <= 0:
-                        value = 1500  # Default fallback
-                except (tk.TclError, ValueError):
-                    value = 1500  # Default fallback
-            elif settings_path == "transition.blank_time_between_transitions":
-                try:
-                    value = self.blank_time_var.get()
-                except (tk.TclError, ValueError):
-                    value = 0  # Default fallback
-            # Effect transition settings
-            elif settings_path == "transition.transition_color_scheme":
-                value = self.transition_color_scheme_var.get()
-            elif settings_path == "transition.color_scheme_order":
-                value = self.color_scheme_order_var.get()
-            elif settings_path == "transition.transition_color_mode":
-                value = self.transition_color_mode_var.get()
-            elif settings_path == "transition.color_mode_order":
-                value = self.color_mode_order_var.get()
-            elif settings_path == "transition.transition_ghost_params":
-                value = self.transition_ghost_params_var.get()
-            elif settings_path == "transition.ghost_params_order":
-                value = self.ghost_params_order_var.get()
-            elif settings_path == "transition.ghost_chance_min":
-                value = self.ghost_chance_min_var.get()
-            elif settings_path == "transition.ghost_chance_max":
-                value = self.ghost_chance_max_var.get()
-            elif settings_path == "transition.ghost_decay_min":
-                value = self.ghost_decay_min_var.get()
-            elif settings_path == "transition.ghost_decay_max":
-                value = self.ghost_decay_max_var.get()
-            elif settings_path == "transition.transition_flicker_params":
-                value = self.transition_flicker_params_var.get()
-            elif settings_path == "transition.flicker_params_order":
-                value = self.flicker_params_order_var.get()
-            elif settings_path == "transition.flicker_chance_min":
-                value = self.flicker_chance_min_var.get()
-            elif settings_path == "transition.flicker_chance_max":
-                value = self.flicker_chance_max_var.get()
-            elif settings_path == "transition.flicker_intensity_min":
-                value = self.flicker_intensity_min_var.get()
-            elif settings_path == "transition.flicker_intensity_max":
-                value = self.flicker_intensity_max_var.get()
-            elif settings_path == "transition.transition_speed_variation":
-                value = self.transition_speed_variation_var.get()
-            elif settings_path == "transition.speed_order":
-                value = self.speed_order_var.get()
-            elif settings_path == "transition.speed_min":
-                value = self.speed_min_var.get()
-            elif settings_path == "transition.speed_max":
-                value = self.speed_max_var.get()
-            elif settings_path == "file_monitoring.file_check_interval":
-                try:
-                    value = self.file_check_interval_var.get()
-                    if value <= 0:
-                        value = 60  # Default fallback
-                except (tk.TclError, ValueError):
-                    value = 60  # Default fallback
-            elif settings_path == "debug.debug_output_interval":
-                try:
-                    value = self.debug_interval_var.get()
-                    if value <= 0:
-                        value = 300  # Default fallback
-                except (tk.TclError, ValueError):
-                    value = 300  # Default fallback
-            else:
-                # Fallback for any other widgets
-                if isinstance(widget, (ttk.Spinbox, ttk.Combobox)):
-                    value = widget.get()
-                else:
-                    return
-            
-            # Convert value
-            converted_value = converter(value)
-            
-            # Set value in settings using path
-            obj = self.settings
-            path_parts = settings_path.split('.')
-            for part in path_parts[:-1]:
-                obj = getattr(obj, part)
-            setattr(obj, path_parts[-1], converted_value)
-            
-        except Exception as e:
-            print(f"Error updating setting {settings_path}: {e}")
+            set_label(variable.get())
+        except tk.TclError:
+            set_label(None)
+        return slider
+        
+    def _idle_debounced(self, func: Callable) -> Callable:
+        """Wrap a readout refresh so bursts of slider callbacks run it once per idle cycle."""
+        pending = False
+        
+        def run():
+            nonlocal pending
+            pending = False
+            func()
+        
+        def schedule(*args):
+            nonlocal pending
+            if not pending:
+                pending = True
+                self.root.after_idle(run)
+        return schedule
+        
+    @contextmanager
+    def _batch_update(self):
+        """Group programmatic variable writes, then refresh all readouts in one idle pass."""
+        was_batching = self._batching
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = was_batching
+            if not was_batching:
+                self.root.after_idle(self._refresh_all_labels)
+        
+    def _refresh_all_labels(self):
+        """Refresh slider readouts and the frame/seconds readouts."""
+        self._refresh_slider_labels()
+        for refresh in self._label_refreshers:
+            refresh()
+        
+    def _refresh_slider_labels(self):
+        """Resync every slider readout with its variable after programmatic updates."""
+        for variable, setters in self._slider_labels.values():
+            try:
+                value = variable.get()
+            except (tk.TclError, ValueError):
+                value = None
+            for setter in setters:
+                setter(value)
+        
+    def _bind_var(self, settings_path: str, value_var: tk.Variable, converter: Callable, default: Any = None):
+        """Bind a tk variable to a settings path for manual saving.
+        
+        If default is given, unreadable or non-positive values fall back to it
+        on save. The path's parent getter is built once per class in _PATH_GETTERS.
+        """
+        self._bindings.append((settings_path, value_var, converter, default))
+        if settings_path not in self._PATH_GETTERS:
+            parent_path, _, attr = settings_path.rpartition('.')
+            self._PATH_GETTERS[settings_path] = (attrgetter(parent_path), attr)
+        
+    @staticmethod
+    def _read_bound_value(value_var: tk.Variable, converter: Callable, default: Any) -> Any:
+        """Read and convert a bound variable, falling back to default if one is set."""
+        if default is None:
+            return converter(value_var.get())
+        try:
+            value = converter(value_var.get())  # Spinboxes bound directly return text
+            if value <= 0:
+                value = converter(default)
+        except (tk.TclError, ValueError):
+            value = converter(default)
+        return value
+    
+    def _widgets_match_settings(self) -> bool:
+        """Return True if every bound variable already holds its value in self.settings."""
+        try:
+            for settings_path, value_var, converter, default in self._bindings:
+                parent, attr = self._resolve_setting_path(settings_path)
+                if getattr(parent, attr) != self._read_bound_value(value_var, converter, default):
+                    return False
+        except (tk.TclError, ValueError):
+            return False
+        return True
+    
+    def _bind_spinbox(self, spin: ttk.Spinbox, settings_path: str, converter: Callable, default: Any = None,
+                      restore_invalid: bool = False):
+        """Bind a variable-less spinbox: its text is read directly on save, and
+        committed to self.settings when editing finishes (focus out or Return).
+        
+        With restore_invalid, text rejected by the spinbox's focusout validation
+        is replaced with the last committed value.
+        """
+        self._bind_var(settings_path, spin, converter, default)
+        if restore_invalid:
+            # Tk ignores a failed focusout validation unless invalidcommand acts on it
+            spin.configure(invalidcommand=self.root.register(
+                partial(self._restore_committed_value, spin, settings_path)))
+        commit = partial(self._commit_bound_value, settings_path, spin, converter, default)
+        spin.bind('<FocusOut>', commit)
+        spin.bind('<Return>', commit)
+    
+    def _restore_committed_value(self, spin: ttk.Spinbox, settings_path: str):
+        """Spinbox invalidcommand: put the value last committed to self.settings back in the box."""
+        parent, attr = self._resolve_setting_path(settings_path)
+        self._set_spinbox(spin, getattr(parent, attr))
+        # Editing the text from invalidcommand turns validation off; turn it back on
+        spin.after_idle(lambda: spin.configure(validate='focusout'))
+    
+    def _commit_bound_value(self, settings_path: str, value_var, converter: Callable, default: Any, event=None):
+        """Event handler (pre-bound with partial) that writes one bound value into self.settings."""
+        self._assign_setting(settings_path, self._read_bound_value(value_var, converter, default))
+    
+    def _assign_setting(self, settings_path: str, value: Any):
+        """Set a setting if its value changed, marking the settings dirty."""
+        parent, attr = self._resolve_setting_path(settings_path)
+        if getattr(parent, attr) != value:
+            setattr(parent, attr, value)
+            self._dirty = True
+    
+    @staticmethod
+    def _set_spinbox(spin: ttk.Spinbox, value):
+        """Replace a variable-less spinbox's text with value."""
+        spin.delete(0, tk.END)
+        spin.insert(0, str(value))
+    
+    def _resolve_setting_path(self, settings_path: str) -> Tuple[object, str]:
+        """Return (parent object, attribute name) for a dotted settings path.
+        
+        Cached until self.settings is replaced, which clears _path_cache.
+        """
+        cached = self._path_cache.get(settings_path)
+        if cached is None:
+            get_parent, attr = self._PATH_GETTERS[settings_path]
+            cached = self._path_cache[settings_path] = (get_parent(self.settings), attr)
+        return cached
     
     def _load_current_settings(self):
         """Load current settings from file if it exists."""
-        settings_file = "config/user_settings.json"
-        if os.path.exists(settings_file):
-            try:
-                self.settings = Settings.load_from_file(settings_file)
-                self._update_widgets_from_settings()
-            except Exception as e:
-                print(f"Error loading settings: {e}")
+        try:
+            self.settings, clean = _load_settings_cached("config/user_settings.json")
+            self._path_cache.clear()
+            self._update_widgets_from_settings()
+            # A broken or invalid file loads as defaults; stay dirty so Save rewrites it
+            self._dirty = not clean
+        except FileNotFoundError:
+            pass  # No saved settings yet; keep defaults
+        except Exception as e:
+            print(f"Error loading settings: {e}")
     
     def _update_widgets_from_settings(self):
-        """Update all widgets to reflect current settings values."""
-        # Overlay settings
-        self.overlay_enabled_var.set(self.settings.overlay.overlay_enabled)
-        self.color_scheme_var.set(self.settings.overlay.color_scheme.value)
-        self.transition_mode_var.set(self.settings.overlay.color_transition_mode.value)
-        self.ghost_chance_var.set(self.settings.overlay.ghost_chance)
-        self.ghost_decay_var.set(self.settings.overlay.ghost_decay)
-        self.flicker_chance_var.set(self.settings.overlay.flicker_chance)
-        self.enable_color_averaging_var.set(self.settings.overlay.enable_color_averaging)
-        self.color_averaging_interval_var.set(self.settings.overlay.color_averaging_interval)
-        
-        # Transition settings
-        self.transition_speed_var.set(self.settings.transition.transition_speed)
-        self.text_change_interval_var.set(self.settings.transition.text_change_interval)
-        self.blank_time_var.set(self.settings.transition.blank_time_between_transitions)
-        self.shuffle_text_order_var.set(self.settings.transition.shuffle_text_order)
-        
-        # Effect transition settings
-        self.transition_color_scheme_var.set(self.settings.transition.transition_color_scheme)
-        self.color_scheme_order_var.set(self.settings.transition.color_scheme_order)
-        self.transition_color_mode_var.set(self.settings.transition.transition_color_mode)
-        self.color_mode_order_var.set(self.settings.transition.color_mode_order)
-        self.transition_ghost_params_var.set(self.settings.transition.transition_ghost_params)
-        self.ghost_params_order_var.set(self.settings.transition.ghost_params_order)
-        self.ghost_chance_min_var.set(self.settings.transition.ghost_chance_min)
-        self.ghost_chance_max_var.set(self.settings.transition.ghost_chance_max)
-        self.ghost_decay_min_var.set(self.settings.transition.ghost_decay_min)
-        self.ghost_decay_max_var.set(self.settings.transition.ghost_decay_max)
-        self.transition_flicker_params_var.set(self.settings.transition.transition_flicker_params)
-        self.flicker_params_order_var.set(self.settings.transition.flicker_params_order)
-        self.flicker_chance_min_var.set(self.settings.transition.flicker_chance_min)
-        self.flicker_chance_max_var.set(self.settings.transition.flicker_chance_max)
-        self.flicker_intensity_min_var.set(self.settings.transition.flicker_intensity_min)
-        self.flicker_intensity_max_var.set(self.settings.transition.flicker_intensity_max)
-        self.transition_speed_variation_var.set(self.settings.transition.transition_speed_variation)
-        self.speed_order_var.set(self.settings.transition.speed_order)
-        self.speed_min_var.set(self.settings.transition.speed_min)
-        self.speed_max_var.set(self.settings.transition.speed_max)
+        """Update all widgets to reflect current settings values.
         
-        # Advanced settings
-        self.file_check_interval_var.set(self.settings.file_monitoring.file_check_interval)
-        self.debug_interval_var.set(self.settings.debug.debug_output_interval)
+        Tabs that have not been built yet are skipped; they read self.settings
+        when they are first shown. Readouts are refreshed once at the end.
+        """
+        with self._batch_update():
+            self._set_widget_values()
         
         # Text file selection - load current selection
         self._load_current_text_file_selection()
-        self._update_file_info()
-    
-
+        if self._text_file_info_loaded:
+            self._update_file_info()
     
-    def _load_demo_settings(self):
-        """Load demo settings preset."""
-        self.settings = create_demo_settings()
-        self._update_widgets_from_settings()
-        self._show_status("Demo settings loaded (press Save to apply)", "blue")
+    def _set_widget_values(self):
+        """Copy self.settings into the tk variables of every built tab."""
+        o = self.settings.overlay
+        t = self.settings.transition
+        
+        self.shuffle_text_order_var.set(t.shuffle_text_order)
+        self.shared.update_from(t)
+        
+        # Overlay settings
+        if self._is_tab_built(self.effects_frame):
+            self.overlay_enabled_var.set(o.overlay_enabled)
+            self.color_scheme_var.set(o.color_scheme.value)
+            self.transition_mode_var.set(o.color_transition_mode.value)
+            self.ghost_chance_var.set(o.ghost_chance)
+            self.ghost_decay_var.set(o.ghost_decay)
+            self.flicker_chance_var.set(o.flicker_chance)
+            self.enable_color_averaging_var.set(o.enable_color_averaging)
+            self.color_averaging_interval_var.set(o.color_averaging_interval)
+        
+        if self._is_tab_built(self.transitions_frame):
+            # Transition settings
+            self.transition_speed_var.set(t.transition_speed)
+            self.text_change_interval_var.set(t.text_change_interval)
+            self.blank_time_var.set(t.blank_time_between_transitions)
+            
+            # Effect transition settings
+            self.transition_color_scheme_var.set(t.transition_color_scheme)
+            self.color_scheme_order_var.set(t.color_scheme_order)
+            self.transition_color_mode_var.set(t.transition_color_mode)
+            self.color_mode_order_var.set(t.color_mode_order)
+            self.transition_ghost_params_var.set(t.transition_ghost_params)
+            self.ghost_params_order_var.set(t.ghost_params_order)
+            self.transition_flicker_params_var.set(t.transition_flicker_params)
+            self.flicker_params_order_var.set(t.flicker_params_order)
+            self.transition_speed_variation_var.set(t.transition_speed_variation)
+            self.speed_order_var.set(t.speed_order)
+        
+        # Advanced settings
+        if self._is_tab_built(self.advanced_frame):
+            self._set_spinbox(self.file_check_spin, self.settings.file_monitoring.file_check_interval)
+            self._set_spinbox(self.debug_spin, self.settings.debug.debug_output_interval)
     
-    def _load_transgender_settings(self):
-        """Load transgender pride settings preset."""
-        self.settings = create_transgender_pride_settings()
-        self._update_widgets_from_settings()
-        self._show_status("Transgender pride settings loaded (press Save to apply)", "blue")
+
     
-    def _load_performance_settings(self):
-        """Load performance settings preset."""
-        self.settings = create_performance_settings()
+    def _load_preset(self, name: str):
+        """Load a settings preset by its button name.
+        
+        Re-clicking the preset that is already loaded, with no unsaved widget
+        edits, is a no-op rather than a full widget refresh.
+        """
+        factory, label = self._presets[name]
+        settings = factory()
+        if settings == self.settings and self._widgets_match_settings():
+            self._show_status(f"{label} settings already loaded", "blue")
+            return
+        self.settings = settings
+        self._path_cache.clear()
+        self._dirty = True
         self._update_widgets_from_settings()
-        self._show_status("Performance settings loaded (press Save to apply)", "blue")
+        self._show_status(f"{label} settings loaded (press Save to apply)", "blue")
     
     def _load_settings_file(self):
         """Load settings from a file dialog."""
         filename = filedialog.askopenfilename(
+            parent=self.root,
             title="Load Settings File",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             initialdir="config"
         )
         if filename:
-            try:
-                self.settings = Settings.load_from_file(filename)
-                self._update_widgets_from_settings()
-                self._show_status(f"Loaded: {os.path.basename(filename)}", "green")
-            except Exception as e:
-                self._show_status(f"Error loading: {str(e)}", "red")
+            # Parse on the I/O worker so a slow disk doesn't freeze the window
+            self._run_in_background(_load_settings_cached,
+                                    lambda future: self._on_settings_file_loaded(future, filename), filename)
+    
+    def _on_settings_file_loaded(self, future: concurrent.futures.Future, filename: str):
+        """Apply a settings file loaded in the background (runs on the Tk thread)."""
+        try:
+            settings, _clean = future.result()
+        except Exception as e:
+            self._show_status(f"Error loading: {str(e)}", "red")
+            return
+        self.settings = settings
+        self._path_cache.clear()
+        self._dirty = True
+        self._update_widgets_from_settings()
+        self._show_status(f"Loaded: {self._basename(filename)}", "green")
     
     def _save_settings_file(self):
         """Save settings to a file dialog."""
         filename = filedialog.asksaveasfilename(
+            parent=self.root,
             title="Save Settings File",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             initialdir="config",
             defaultextension=".json"
         )
         if filename:
-            try:
-                self.settings.save_to_file(filename)
-                self._show_status(f"Saved: {os.path.basename(filename)}", "green")
-            except Exception as e:
-                self._show_status(f"Error saving: {str(e)}", "red")
+            self._run_in_background(self._write_settings_file, self._on_settings_file_saved,
+                                    copy.deepcopy(self.settings), filename)
     
-
+    def _write_settings_file(self, snapshot: Settings, filename: str) -> str:
+        """Write a settings snapshot to filename (runs on the I/O worker)."""
+        if not snapshot.save_to_file(filename):
+            raise IOError(f"could not write {filename}")
+        return filename
+    
+    def _on_settings_file_saved(self, future: concurrent.futures.Future):
+        """Report the result of a background settings-file save on the Tk thread."""
+        try:
+            filename = future.result()
+        except Exception as e:
+            self._show_status(f"Error saving: {str(e)}", "red")
+            return
+        self._show_status(f"Saved: {self._basename(filename)}", "green")
     
     def _save_current_settings(self):
         """Save current settings to file."""
         try:
-            # Update settings from all widgets first
-            for widget in self.widget_bindings:
-                self._update_setting_from_widget(widget)
+            # Update settings from all bound variables first
+            for settings_path, value_var, converter, default in self._bindings:
+                self._assign_setting(settings_path, self._read_bound_value(value_var, converter, default))
             
             # Check if text file selection changed
             selected_file = self.text_file_var.get()
             text_file_changed = selected_file != self.current_text_file
             
-            # Validate and save settings
+            if not self._dirty and not text_file_changed:
+                self._show_status("No changes to save", "gray")
+                return
+            
+            # Validate on the Tk thread, then hand a snapshot to the I/O worker
             is_valid = self.settings.validate()
             if is_valid:
-                os.makedirs("config", exist_ok=True)
-                self.settings.save_to_file("config/user_settings.json")
-                
-                # Apply text file change if it changed
-                if text_file_changed:
-                    self.current_text_file = selected_file
-                    self._save_text_file_selection()
-                    self._update_file_info()  # Update to show current file info
-                    self._show_status(f"Settings saved, text file changed to: {os.path.basename(selected_file)}", "green")
-                else:
-                    self._show_status("Settings saved", "green")
+                snapshot = copy.deepcopy(self.settings)
+                self._dirty = False  # Edits made while the save is in flight mark it dirty again
+                # Skip rewriting the selection file when it already holds the selection
+                write_selection = text_file_changed and selected_file != self._last_saved_text_file
+                self._run_in_background(self._do_save, self._on_save_done,
+                                        snapshot, selected_file if text_file_changed else None,
+                                        write_selection)
             else:
                 self._show_status("Validation error - check inputs", "red")
         except Exception as e:
             self._show_status(f"Save error: {str(e)}", "red")
     
+    def _do_save(self, snapshot: Settings, selected_file: Optional[str], write_selection: bool) -> Optional[str]:
+        """Write settings and text file selection to disk (runs on the I/O worker).
+        
+        Returns selected_file, which the selection file holds once this succeeds.
+        """
+        self._ensure_config_dir()
+        if not snapshot.save_to_file("config/user_settings.json"):
+            raise IOError("could not write config/user_settings.json")
+        
+        # Apply text file change if it changed
+        if write_selection:
+            self._save_text_file_selection(selected_file)
+        return selected_file
+    
+    def _ensure_config_dir(self):
+        """Create the config directory on the first save of this session only."""
+        if not self._config_dir_ensured:
+            os.makedirs("config", exist_ok=True)
+            self._config_dir_ensured = True
+    
+    def _on_save_done(self, future: concurrent.futures.Future):
+        """Report the result of a background save on the Tk thread."""
+        try:
+            selected_file = future.result()
+        except Exception as e:
+            self._dirty = True
+            self._show_status(f"Save error: {str(e)}", "red")
+            return
+        
+        if selected_file is not None:
+            self._last_saved_text_file = selected_file
+            self.current_text_file = selected_file
+            self._update_file_info()  # Update to show current file info
+            self._show_status(f"Settings saved, text file changed to: {self._basename(selected_file)}", "green")
+        else:
+            self._show_status("Settings saved", "green")
+    
+    def _run_in_background(self, func: Callable, on_done: Callable, *args):
+        """Run blocking file I/O on the worker thread and call on_done(future) on the Tk thread."""
+        future = self._io_pool.submit(func, *args)
+        self.root.after(50, self._poll_future, future, on_done)
+    
+    def _poll_future(self, future: concurrent.futures.Future, on_done: Callable):
+        """Poll a background job from the Tk thread so widgets are only touched there."""
+        if future.done():
+            on_done(future)
+        else:
+            self.root.after(50, self._poll_future, future, on_done)
+    
     def _show_status(self, message: str, color: str = "black"):
         """Show status message in the GUI without popups or sounds."""
         if self.status_label:
-            self.status_label.config(text=message, foreground=color)
-            # Clear status after 3 seconds
-            self.root.after(3000, lambda: self.status_label.config(text="Ready", foreground="gray") if self.status_label else None)
+            self._status_config(text=message, foreground=color)
+            # Clear status after 3 seconds, restarting the timer for each new message
+            if self._status_after_id is not None:
+                self.root.after_cancel(self._status_after_id)
+            self._status_after_id = self.root.after(3000, self._clear_status)
+    
+    def _clear_status(self):
+        """Reset the status label once its message has been shown for 3 seconds."""
+        self._status_after_id = None
+        if self.status_label:
+            self._status_config(text="Ready", foreground="gray")
     
     def _get_available_text_files(self):
-        """Get list of available text files."""
-        text_files = []
+        """Get list of available text files.
+        
+        The listing is cached per directory and reused until the directory's
+        mtime changes (which happens when files are added, removed or renamed).
+        """
         text_dir = "TextInputFiles"
-        if os.path.exists(text_dir):
-            for file in os.listdir(text_dir):
-                if file.endswith('.txt'):
-                    text_files.append(os.path.join(text_dir, file))
-        return text_files
+        try:
+            mtime_ns = os.stat(text_dir).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._DIR_CACHE.get(text_dir)
+        if cached is None or cached[0] != mtime_ns:
+            with os.scandir(text_dir) as it:
+                text_files = [os.path.join(text_dir, entry.name) for entry in it
+                              if entry.name.endswith('.txt') and entry.is_file(follow_symlinks=False)]
+            cached = self._DIR_CACHE[text_dir] = (mtime_ns, text_files)
+        return list(cached[1])
     
     def _on_text_file_changed(self, event=None):
-        """Handle text file selection change."""
+        """Handle text file selection change, waiting 150 ms for the selection to settle.
+        
+        Mouse-wheel scrolling over the combobox selects on every notch, so a scroll
+        through the list previews only where it stops.
+        """
+        if self._pending_preview is not None:
+            self.root.after_cancel(self._pending_preview)
+        self._pending_preview = self.root.after(150, self._do_preview)
+    
+    def _do_preview(self):
+        """Preview the settled combobox selection."""
+        self._pending_preview = None
         new_file = self.text_file_var.get()
         if new_file != self.current_text_file:
             # Just update the preview, don't save yet
             self._update_file_info_for_file(new_file)
-            self._show_status(f"Previewing: {os.path.basename(new_file)} (press Save to apply)", "orange")
+            self._show_status(f"Previewing: {self._basename(new_file)} (press Save to apply)", "orange")
     
     def _update_file_info(self):
         """Update file info and preview for current text file."""
         self._update_file_info_for_file(self.current_text_file)
     
     def _update_file_info_for_file(self, file_path):
-        """Update file info and preview for specified file."""
-        if not os.path.exists(file_path):
-            self.file_info_label.config(text="File not found")
-            self._update_preview("File not found")
-            return
+        """Update file info and preview for specified file.
+        
+        The file is read on the I/O worker. Each request takes a new token and
+        results for anything but the latest request are dropped, so quickly
+        switching files never shows a stale preview.
+        """
+        self._preview_token += 1
+        token = self._preview_token
+        self._run_in_background(self._read_file_info,
+                                lambda future: self._apply_file_info(future, token), file_path)
+    
+    @staticmethod
+    def _read_file_info(file_path) -> Tuple[str, str]:
+        """Return (info text, preview text) for a text file (pure I/O, no Tk calls).
         
+        Results are cached by (path, mtime, size), so flipping back to an
+        unchanged file costs a single stat.
+        """
         try:
-            # Get file stats
-            file_size = os.path.getsize(file_path)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                line_count = len(content.split('\n\n'))  # Count text blocks
-                char_count = len(content)
-            
-            info = f"Size: {file_size} bytes | Blocks: {line_count} | Characters: {char_count}"
-            self.file_info_label.config(text=info)
-            
-            # Update preview
-            preview_lines = content.split('\n')[:20]  # First 20 lines
-            preview = '\n'.join(preview_lines)
-            if len(content.split('\n')) > 20:
-                preview += "\n\n... (truncated)"
-            self._update_preview(preview)
-            
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return "File not found", "File not found"
+        except OSError as e:
+            return f"Error reading file: {e}", f"Error: {e}"
+        
+        try:
+            return _read_text_file_info(file_path, st.st_mtime_ns, st.st_size)
         except Exception as e:
-            self.file_info_label.config(text=f"Error reading file: {e}")
-            self._update_preview(f"Error: {e}")
+            return f"Error reading file: {e}", f"Error: {e}"
+    
+    def _apply_file_info(self, future: concurrent.futures.Future, token: int):
+        """Show a background file read on the Tk thread unless a newer one was requested."""
+        if token != self._preview_token:
+            return
+        try:
+            info, preview = future.result()
+        except Exception as e:  # _read_file_info reports its own errors; this is a last resort
+            info, preview = f"Error reading file: {e}", f"Error: {e}"
+        self.file_info_label.config(text=info)
+        self._update_preview(preview)
     
     def _update_preview(self, text):
         """Update the preview text widget."""
         self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, text)
+        self.preview_text.replace('1.0', tk.END, text)  # One edit instead of delete + insert
         self.preview_text.config(state=tk.DISABLED)
     
-    def _save_text_file_selection(self):
-        """Save the selected text file to a separate config file for the main app."""
+    def _save_text_file_selection(self, text_file: str):
+        """Save the selected text file to a separate config file for the main app.
+        
+        Called from the I/O worker, so errors are raised rather than shown here,
+        and _last_saved_text_file is left to the Tk thread. Writes a temp file
+        and renames it over the old one so readers never see a partial path.
+        """
+        self._ensure_config_dir()
+        fd, tmp_path = tempfile.mkstemp(dir="config", prefix=".current_text_file.", suffix=".tmp", text=True)
         try:
-            os.makedirs("config", exist_ok=True)
-            with open("config/current_text_file.txt", 'w') as f:
-                f.write(self.current_text_file)
-        except Exception as e:
-            self._show_status(f"Error saving text file selection: {e}", "red")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text_file)
+            os.replace(tmp_path, "config/current_text_file.txt")
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def _load_current_text_file_selection(self):
         """Load the current text file selection from config."""
@@ -1207,6 +1307,7 @@ class SettingsGUI:
             if os.path.exists("config/current_text_file.txt"):
                 with open("config/current_text_file.txt", 'r', encoding='utf-8') as f:
                     saved_file = f.read().strip()
+                self._last_saved_text_file = saved_file
                 if os.path.exists(saved_file):
                     self.current_text_file = saved_file
                     self.text_file_var.set(saved_file)
@@ -1216,6 +1317,7 @@ class SettingsGUI:
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        self._io_pool.shutdown(wait=True)  # Let any in-flight save finish
 
 
 def main():
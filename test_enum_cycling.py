@@ -6,6 +6,10 @@ Run this to check if the M key cycling functionality is working with enums.
 from config.enums import TransitionMode, ColorScheme
 from screen_overlay import ScreenOverlay
 
+# All color schemes in cycling order, and each scheme's position in it
+_ALL_SCHEMES = tuple(ColorScheme)
+_SCHEME_INDEX = {scheme: i for i, scheme in enumerate(_ALL_SCHEMES)}
+
 def test_transition_mode_cycling():
     """Test that transition mode cycling works with enums."""
     print("=== Testing Transition Mode Cycling ===\n")
@@ -29,16 +33,7 @@ def test_transition_mode_cycling():
         print(f"Step {i+1}: Current mode = {current_mode.value}")
         
         # Apply the same cycling logic as in screendisplayer.py
-        if current_mode == TransitionMode.SMOOTH:
-            new_mode = TransitionMode.SNAP
-        elif current_mode == TransitionMode.SNAP:
-            new_mode = TransitionMode.MIXED
-        elif current_mode == TransitionMode.MIXED:
-            new_mode = TransitionMode.SPREAD_HORIZONTAL
-        elif current_mode == TransitionMode.SPREAD_HORIZONTAL:
-            new_mode = TransitionMode.SPREAD_VERTICAL
-        else:  # SPREAD_VERTICAL
-            new_mode = TransitionMode.SMOOTH
+        new_mode = current_mode.next()
             
         # Set the mode on the overlay
         success = overlay.set_color_transition_mode(new_mode)
@@ -60,7 +55,7 @@ def test_color_scheme_cycling():
     overlay = ScreenOverlay(10, 10, 10, 1.0)
     
     # Test cycling through first few color schemes
-    all_schemes = list(ColorScheme)
+    all_schemes = _ALL_SCHEMES
     print(f"Available schemes ({len(all_schemes)} total):")
     for i, scheme in enumerate(all_schemes[:5]):  # Show first 5
         print(f"  {i+1}. {scheme.value}")
@@ -75,11 +70,7 @@ def test_color_scheme_cycling():
         print(f"Step {i+1}: Current scheme = {current_scheme.value}")
         
         # Find next scheme (same logic as in screendisplayer.py)
-        try:
-            current_index = all_schemes.index(current_scheme)
-            next_index = (current_index + 1) % len(all_schemes)
-        except ValueError:
-            next_index = 0
+        next_index = (_SCHEME_INDEX.get(current_scheme, -1) + 1) % len(all_schemes)
         
         next_scheme = all_schemes[next_index]
         
@@ -1,48 +1,120 @@
 import random
 import os
+from array import array
+import threading
+import hashlib
 import time
+import logging
 from typing import List, Optional, Callable
 from config.settings import Settings
+from config.enums import ColorScheme, TransitionMode
+
+logger = logging.getLogger(__name__)
+
+# Optional: event-driven file monitoring. Without watchdog, files are polled every file_check_interval frames.
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Seconds to wait after the last file event before checking, so editor save/rename bursts reload once
+FILE_EVENT_DEBOUNCE = 0.1
+
+# With a file watcher, files are still polled every file_check_interval * WATCHER_POLL_FACTOR frames
+# in case an event is missed or the watcher thread dies
+WATCHER_POLL_FACTOR = 10
+
+# watchdog event types that can change a file's contents (reads and opens are ignored)
+_FILE_CHANGE_EVENTS = frozenset(("created", "modified", "moved", "deleted"))
+
+# Enum members, enumerated once at import; order lists copy these and random picks index them
+_COLOR_SCHEMES = tuple(ColorScheme)
+_TRANSITION_MODES = tuple(TransitionMode)
+
+
+def _normalize_path(path: str) -> str:
+    """Absolute, case-normalized form of path for comparing file event paths"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _get_mtime_ns(path: str) -> Optional[int]:
+    """Return path's modification time in integer nanoseconds, or None if it does not exist (one stat call)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class _FileChangeEventHandler:
+    """watchdog event handler that sets a threading.Event for the frame loop when a watched file changes.
+    
+    Only changes to the files in watched_paths (normalized with _normalize_path) are signalled.
+    """
+    
+    def __init__(self, changed: threading.Event):
+        self.changed = changed
+        self.watched_paths: frozenset = frozenset()  # Rebound as a whole, never mutated, since the watcher thread reads it
+    
+    def dispatch(self, event) -> None:
+        if event.is_directory or event.event_type not in _FILE_CHANGE_EVENTS:
+            return
+        watched_paths = self.watched_paths
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            if path and _normalize_path(path) in watched_paths:
+                self.changed.set()
+                return
 
 class TransitionManager:
     def __init__(self, screen_displayer, settings: Optional[Settings] = None):
         self.displayer = screen_displayer
         self.frame_count = 0
+        self._rng = random.Random()  # Private generator for shuffles and effect picks; seed it for reproducible runs
         
         # Store settings reference, create default if none provided
         self.settings = settings if settings is not None else Settings.create_default()
         
         # Transition scheduling
         self.text_change_interval = 1500  # frames between text changes (25 seconds at 60fps)
+        self._next_text_change = self.text_change_interval  # Frame of the next scheduled text change
         self.current_text_block = 0
         
         # Text order management for shuffling
-        self.text_order_indices = []  # List of indices for text blocks
+        self.text_order_indices = array('i')  # Indices of text blocks, stored as C ints
         self.current_order_position = 0  # Current position in the order list
-        self._last_shuffle_setting = self.settings.transition.shuffle_text_order  # Track shuffle setting changes
-        self.shuffle_check_interval = 180  # Check shuffle setting every 180 frames (3 seconds)
+        self._shuffle_on = self.settings.transition.shuffle_text_order  # Cached shuffle setting, updated on change
+        self.settings_check_interval = 180  # Check effect transition settings every 180 frames (3 seconds)
+        self._next_settings_check = self.settings_check_interval
         
         # Blank transition state
         self.is_in_blank_period = False
         self.blank_period_start_frame = 0
+        self._tick = self._tick_running  # Per-frame step for the current state; rebound when a blank period starts or ends
         self.blank_time_between_transitions = self.settings.transition.blank_time_between_transitions
         
         # File monitoring
         self.text_file_path = None
-        self.last_file_mtime = 0
+        self.last_file_mtime = 0  # Modification times are st_mtime_ns integers
         self.file_check_interval = self.settings.file_monitoring.file_check_interval
+        self._next_file_check = self.file_check_interval
         
         # Settings file monitoring
         self.settings_file_path = "config/user_settings.json"
-        self.last_settings_mtime = 0
-        if os.path.exists(self.settings_file_path):
-            self.last_settings_mtime = os.path.getmtime(self.settings_file_path)
+        self.last_settings_mtime = _get_mtime_ns(self.settings_file_path) or 0
+        self._last_settings_digest: Optional[bytes] = None  # Digest of the contents last parsed
         
         # Text file selection monitoring
         self.text_file_selection_path = "config/current_text_file.txt"
-        self.last_text_selection_mtime = 0
-        if os.path.exists(self.text_file_selection_path):
-            self.last_text_selection_mtime = os.path.getmtime(self.text_file_selection_path)
+        self.last_text_selection_mtime = _get_mtime_ns(self.text_file_selection_path) or 0
+        self._last_text_selection_content: Optional[str] = None  # Selection last acted on
+        
+        # Event-driven file monitoring (when watchdog is available)
+        self._file_changed = threading.Event()  # Set by the watcher thread, cleared by the frame loop
+        self._file_event_handler = _FileChangeEventHandler(self._file_changed)
+        self._watched_dirs = set()
+        self._file_check_deadline: Optional[float] = None
+        self._observer = None
+        if Observer is not None:
+            self._start_file_watcher()
         
         # Effect transition cycling state
         self.color_scheme_order_indices = []
@@ -58,79 +130,44 @@ class TransitionManager:
         # Initialize effect order lists
         self._initialize_color_scheme_order()
         self._initialize_transition_mode_order()
+        self._cache_effect_transition_settings()
         
         # Callbacks for custom behavior
         self.on_text_change: Optional[Callable[[int], None]] = None
         
-        print("TransitionManager initialized")
+        logger.info("TransitionManager initialized")
+    
+    def _rebuild_order(self, shuffle: bool) -> None:
+        """Rebuild the text order over all text blocks, shuffled or sequential, and restart it"""
+        self.text_order_indices = array('i', range(len(self.displayer.text_content)))
+        if shuffle:
+            self._rng.shuffle(self.text_order_indices)
+        self.current_order_position = 0
+    
+    def _describe_order(self) -> str:
+        """Short description of the current text order for log messages"""
+        if self._shuffle_on:
+            return f"{self.text_order_indices[:10].tolist()}{'...' if len(self.text_order_indices) > 10 else ''}"
+        return f"0 to {len(self.text_order_indices)-1}"
     
     def _initialize_text_order(self) -> None:
         """Initialize or regenerate the text order based on current settings"""
-        if not self.displayer.text_content:
-            self.text_order_indices = []
-            return
-            
-        # Create list of all text block indices
-        self.text_order_indices = list(range(len(self.displayer.text_content)))
-        
-        # Apply ordering based on shuffle setting
-        if self.settings.transition.shuffle_text_order:
-            # Only shuffle if we're turning shuffle ON (not every time settings reload)
-            random.shuffle(self.text_order_indices)
-            print(f"Text order shuffled: {self.text_order_indices[:10]}{'...' if len(self.text_order_indices) > 10 else ''}")
-        else:
-            # Keep sequential order when shuffle is OFF
-            print(f"Text order sequential: 0 to {len(self.text_order_indices)-1}")
-            
-        self.current_order_position = 0
+        self._rebuild_order(self._shuffle_on)
+        if self.text_order_indices:
+            logger.debug("Text order %s: %s", 'shuffled' if self._shuffle_on else 'sequential', self._describe_order())
     
     def _update_text_order_for_shuffle_change(self, new_shuffle_setting: bool) -> None:
         """Update text order when shuffle setting changes via GUI"""
-        if not self.displayer.text_content:
-            return
-            
-        old_shuffle_setting = getattr(self, '_last_shuffle_setting', False)
+        old_shuffle_setting = self._shuffle_on
+        self._shuffle_on = new_shuffle_setting
         
         # Only change order if the shuffle setting actually changed
-        if new_shuffle_setting != old_shuffle_setting:
+        if new_shuffle_setting != old_shuffle_setting and self.displayer.text_content:
+            self._rebuild_order(new_shuffle_setting)
             if new_shuffle_setting:
-                # Turning shuffle ON - create new shuffled order
-                self.text_order_indices = list(range(len(self.displayer.text_content)))
-                random.shuffle(self.text_order_indices)
-                print(f"Shuffle enabled - new order: {self.text_order_indices[:10]}{'...' if len(self.text_order_indices) > 10 else ''}")
+                logger.info("Shuffle enabled - new order: %s", self._describe_order())
             else:
-                # Turning shuffle OFF - return to sequential order
-                self.text_order_indices = list(range(len(self.displayer.text_content)))
-                print(f"Shuffle disabled - returning to sequential order: 0 to {len(self.text_order_indices)-1}")
-            
-            # Reset position to start of new order
-            self.current_order_position = 0
-            
-        self._last_shuffle_setting = new_shuffle_setting
-    
-    def _check_shuffle_setting_changes(self) -> None:
-        """Check if shuffle setting has changed and update text order accordingly"""
-        # Only check if settings file has been modified since last check
-        if os.path.exists(self.settings_file_path):
-            try:
-                current_settings_mtime = os.path.getmtime(self.settings_file_path)
-                if current_settings_mtime > self.last_settings_mtime:
-                    # File was modified, load and check shuffle setting
-                    current_settings = Settings.load_from_file(self.settings_file_path)
-                    current_shuffle = current_settings.transition.shuffle_text_order
-                    
-                    # Check if shuffle setting changed
-                    if current_shuffle != self._last_shuffle_setting:
-                        print(f"[SHUFFLE] Setting changed: {self._last_shuffle_setting} -> {current_shuffle}")
-                        
-                        # Update our settings reference
-                        self.settings.transition.shuffle_text_order = current_shuffle
-                        
-                        # Update text order based on new setting
-                        self._update_text_order_for_shuffle_change(current_shuffle)
-                        
-            except Exception as e:
-                print(f"Error checking shuffle setting changes: {e}")
+                logger.info("Shuffle disabled - returning to sequential order: %s", self._describe_order())
     
     def _get_next_text_block(self) -> int:
         """Get the next text block index according to current ordering (shuffled or sequential)"""
@@ -140,19 +177,31 @@ class TransitionManager:
         if not self.text_order_indices:
             return 0  # Fallback if no text content
             
-        # Get next index from order
-        next_block = self.text_order_indices[self.current_order_position]
+        order = self.text_order_indices
+        order_length = len(order)
+        position = self.current_order_position
         
-        # Advance position and wrap around
-        self.current_order_position = (self.current_order_position + 1) % len(self.text_order_indices)
+        # With shuffle on, draw this slot from the not-yet-shown blocks (one Fisher-Yates step),
+        # so each cycle is a fresh permutation without an O(N) reshuffle when it wraps
+        if self._shuffle_on:
+            swap = self._rng.randrange(position, order_length)
+            order[position], order[swap] = order[swap], order[position]
         
-        # If we've wrapped around and shuffle is enabled, reshuffle for next cycle
-        # If shuffle is disabled, sequential order will naturally repeat (0,1,2,3,0,1,2,3...)
-        if self.current_order_position == 0 and self.settings.transition.shuffle_text_order:
-            random.shuffle(self.text_order_indices)
-            print(f"Reshuffled text order for new cycle: {self.text_order_indices[:10]}{'...' if len(self.text_order_indices) > 10 else ''}")
-        elif self.current_order_position == 0 and not self.settings.transition.shuffle_text_order:
-            print("Sequential order cycle completed, continuing with: 0, 1, 2, 3...")
+        # Get next index from order
+        next_block = order[position]
+        
+        # Advance position, wrapping to the start without a modulo
+        next_position = position + 1
+        if next_position < order_length:
+            self.current_order_position = next_position
+        else:
+            self.current_order_position = 0
+            
+            # If shuffle is disabled, sequential order will naturally repeat (0,1,2,3,0,1,2,3...)
+            if self._shuffle_on:
+                logger.debug("Shuffled text order cycle completed, next cycle is drawn as it plays")
+            else:
+                logger.debug("Sequential order cycle completed, continuing with: 0, 1, 2, 3...")
         
         # Update current_text_block for compatibility
         self.current_text_block = next_block
@@ -160,51 +209,45 @@ class TransitionManager:
     
     def _initialize_color_scheme_order(self) -> None:
         """Initialize the color scheme order based on current settings"""
-        from config.enums import ColorScheme
-        
         # Create list of all color scheme enum values
-        self.color_scheme_order_indices = list(ColorScheme)
+        self.color_scheme_order_indices = list(_COLOR_SCHEMES)
         
         # Apply ordering based on order mode
         if self.settings.transition.color_scheme_order == "random":
-            random.shuffle(self.color_scheme_order_indices)
-            print(f"Color scheme order shuffled: {[s.value for s in self.color_scheme_order_indices[:5]]}...")
+            self._rng.shuffle(self.color_scheme_order_indices)
+            logger.debug("Color scheme order shuffled: %s...", [s.value for s in self.color_scheme_order_indices[:5]])
         else:
-            print(f"Color scheme order sequential: {len(self.color_scheme_order_indices)} schemes")
+            logger.debug("Color scheme order sequential: %d schemes", len(self.color_scheme_order_indices))
         
         self.current_color_scheme_position = 0
     
     def _initialize_transition_mode_order(self) -> None:
         """Initialize the transition mode order based on current settings"""
-        from config.enums import TransitionMode
-        
         # Create list of all transition mode enum values
-        self.transition_mode_order_indices = list(TransitionMode)
+        self.transition_mode_order_indices = list(_TRANSITION_MODES)
         
         # Apply ordering based on order mode
         if self.settings.transition.color_mode_order == "random":
-            random.shuffle(self.transition_mode_order_indices)
-            print(f"Transition mode order shuffled: {[m.value for m in self.transition_mode_order_indices]}")
+            self._rng.shuffle(self.transition_mode_order_indices)
+            logger.debug("Transition mode order shuffled: %s", [m.value for m in self.transition_mode_order_indices])
         else:
-            print(f"Transition mode order sequential: {len(self.transition_mode_order_indices)} modes")
+            logger.debug("Transition mode order sequential: %d modes", len(self.transition_mode_order_indices))
         
         self.current_transition_mode_position = 0
     
     def _update_color_scheme_order_for_mode_change(self, new_order_mode: str) -> None:
         """Update color scheme order when order mode changes via GUI"""
-        from config.enums import ColorScheme
-        
         old_order_mode = self._last_color_scheme_order
         
         # Only change order if the mode actually changed
         if new_order_mode != old_order_mode:
-            self.color_scheme_order_indices = list(ColorScheme)
+            self.color_scheme_order_indices = list(_COLOR_SCHEMES)
             
             if new_order_mode == "random":
-                random.shuffle(self.color_scheme_order_indices)
-                print(f"Color scheme order changed to random: {[s.value for s in self.color_scheme_order_indices[:5]]}...")
+                self._rng.shuffle(self.color_scheme_order_indices)
+                logger.info("Color scheme order changed to random: %s...", [s.value for s in self.color_scheme_order_indices[:5]])
             else:
-                print(f"Color scheme order changed to sequential")
+                logger.info("Color scheme order changed to sequential")
             
             # Reset position to start
             self.current_color_scheme_position = 0
@@ -213,295 +256,435 @@ class TransitionManager:
     
     def _update_transition_mode_order_for_mode_change(self, new_order_mode: str) -> None:
         """Update transition mode order when order mode changes via GUI"""
-        from config.enums import TransitionMode
-        
         old_order_mode = self._last_transition_mode_order
         
         # Only change order if the mode actually changed
         if new_order_mode != old_order_mode:
-            self.transition_mode_order_indices = list(TransitionMode)
+            self.transition_mode_order_indices = list(_TRANSITION_MODES)
             
             if new_order_mode == "random":
-                random.shuffle(self.transition_mode_order_indices)
-                print(f"Transition mode order changed to random: {[m.value for m in self.transition_mode_order_indices]}")
+                self._rng.shuffle(self.transition_mode_order_indices)
+                logger.info("Transition mode order changed to random: %s", [m.value for m in self.transition_mode_order_indices])
             else:
-                print(f"Transition mode order changed to sequential")
+                logger.info("Transition mode order changed to sequential")
             
             # Reset position to start
             self.current_transition_mode_position = 0
         
         self._last_transition_mode_order = new_order_mode
     
-    def _check_effect_transition_setting_changes(self) -> None:
-        """Check if effect transition settings have changed and update accordingly"""
-        if not os.path.exists(self.settings_file_path):
-            return
+    def _cache_effect_transition_settings(self) -> None:
+        """Recompute the flags _apply_effect_transitions reads; call whenever self.settings changes"""
+        t = self.settings.transition
+        self._any_effect_transition_enabled = (t.transition_color_scheme or t.transition_color_mode
+                                               or t.transition_ghost_params or t.transition_flicker_params
+                                               or t.transition_speed_variation)
+        self._color_scheme_random = t.color_scheme_order != "sequential"
+        self._color_mode_random = t.color_mode_order != "sequential"
+    
+    def _apply_effect_transition_setting_changes(self, current_settings: Settings) -> None:
+        """Update effect transition cycling for changes in freshly reloaded settings.
+        
+        self.settings already holds current_settings; the _last_* trackers hold the previous values.
+        """
+        # Check color scheme transition setting changes
+        current_color_scheme_enabled = current_settings.transition.transition_color_scheme
+        current_color_scheme_order = current_settings.transition.color_scheme_order
+        
+        if current_color_scheme_enabled != self._last_color_scheme_setting:
+            logger.info("[EFFECT] Color scheme transition: %s -> %s", self._last_color_scheme_setting, current_color_scheme_enabled)
+            self._last_color_scheme_setting = current_color_scheme_enabled
+            
+            # Initialize order list if just enabled
+            if current_color_scheme_enabled:
+                self._initialize_color_scheme_order()
         
-        try:
-            current_settings_mtime = os.path.getmtime(self.settings_file_path)
-            if current_settings_mtime > self.last_settings_mtime:
-                # File was modified, load and check effect transition settings
-                current_settings = Settings.load_from_file(self.settings_file_path)
-                
-                # Check color scheme transition setting changes
-                current_color_scheme_enabled = current_settings.transition.transition_color_scheme
-                current_color_scheme_order = current_settings.transition.color_scheme_order
-                
-                if current_color_scheme_enabled != self._last_color_scheme_setting:
-                    print(f"[EFFECT] Color scheme transition: {self._last_color_scheme_setting} -> {current_color_scheme_enabled}")
-                    self.settings.transition.transition_color_scheme = current_color_scheme_enabled
-                    self._last_color_scheme_setting = current_color_scheme_enabled
-                    
-                    # Initialize order list if just enabled
-                    if current_color_scheme_enabled:
-                        self._initialize_color_scheme_order()
-                
-                if current_color_scheme_order != self._last_color_scheme_order:
-                    print(f"[EFFECT] Color scheme order: {self._last_color_scheme_order} -> {current_color_scheme_order}")
-                    self.settings.transition.color_scheme_order = current_color_scheme_order
-                    self._update_color_scheme_order_for_mode_change(current_color_scheme_order)
-                
-                # Check transition mode setting changes
-                current_transition_mode_enabled = current_settings.transition.transition_color_mode
-                current_transition_mode_order = current_settings.transition.color_mode_order
-                
-                if current_transition_mode_enabled != self._last_transition_mode_setting:
-                    print(f"[EFFECT] Transition mode transition: {self._last_transition_mode_setting} -> {current_transition_mode_enabled}")
-                    self.settings.transition.transition_color_mode = current_transition_mode_enabled
-                    self._last_transition_mode_setting = current_transition_mode_enabled
-                    
-                    # Initialize order list if just enabled
-                    if current_transition_mode_enabled:
-                        self._initialize_transition_mode_order()
-                
-                if current_transition_mode_order != self._last_transition_mode_order:
-                    print(f"[EFFECT] Transition mode order: {self._last_transition_mode_order} -> {current_transition_mode_order}")
-                    self.settings.transition.color_mode_order = current_transition_mode_order
-                    self._update_transition_mode_order_for_mode_change(current_transition_mode_order)
-                
-        except Exception as e:
-            print(f"Error checking effect transition setting changes: {e}")
+        if current_color_scheme_order != self._last_color_scheme_order:
+            logger.info("[EFFECT] Color scheme order: %s -> %s", self._last_color_scheme_order, current_color_scheme_order)
+            self._update_color_scheme_order_for_mode_change(current_color_scheme_order)
+        
+        # Check transition mode setting changes
+        current_transition_mode_enabled = current_settings.transition.transition_color_mode
+        current_transition_mode_order = current_settings.transition.color_mode_order
+        
+        if current_transition_mode_enabled != self._last_transition_mode_setting:
+            logger.info("[EFFECT] Transition mode transition: %s -> %s", self._last_transition_mode_setting, current_transition_mode_enabled)
+            self._last_transition_mode_setting = current_transition_mode_enabled
+            
+            # Initialize order list if just enabled
+            if current_transition_mode_enabled:
+                self._initialize_transition_mode_order()
+        
+        if current_transition_mode_order != self._last_transition_mode_order:
+            logger.info("[EFFECT] Transition mode order: %s -> %s", self._last_transition_mode_order, current_transition_mode_order)
+            self._update_transition_mode_order_for_mode_change(current_transition_mode_order)
     
     def set_text_change_interval(self, frames: int) -> None:
         """Set how many frames between text changes"""
+        if frames != self.text_change_interval:
+            # Reschedule from now; re-applying the same interval keeps the current schedule
+            self._next_text_change = self.frame_count + frames
         self.text_change_interval = frames
     
+    def _start_file_watcher(self) -> None:
+        """Start watching the settings and selection files' directories, falling back to polling on failure"""
+        try:
+            self._observer = Observer()
+            self._watch_directory(self.settings_file_path)
+            self._watch_directory(self.text_file_selection_path)
+            if self._observer is not None:
+                self._observer.start()
+                logger.info("File monitoring: watching for change events")
+        except Exception as e:
+            self._fall_back_to_polling(f"could not start file watcher: {e}")
+    
+    def _fall_back_to_polling(self, reason: str) -> None:
+        """Stop the file watcher and poll files every file_check_interval frames instead"""
+        observer, self._observer = self._observer, None
+        if observer is not None and observer.is_alive():
+            observer.stop()
+        self._watched_dirs.clear()
+        self._file_check_deadline = None
+        
+        # The poll schedules did not advance while watching; restart them from the current frame
+        self._next_file_check = self.frame_count + 1
+        self._next_settings_check = self.frame_count + 1
+        logger.warning("File monitoring: %s; polling every %d frames", reason, self.file_check_interval)
+    
+    def _watch_directory(self, file_path: str) -> None:
+        """Have the file watcher report events for file_path, watching its directory."""
+        if self._observer is None:
+            return
+        
+        # Forward events only for the files currently monitored
+        self._file_event_handler.watched_paths = frozenset(
+            _normalize_path(path)
+            for path in (self.settings_file_path, self.text_file_selection_path, self.text_file_path)
+            if path)
+        
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if directory in self._watched_dirs:
+            return
+        if not os.path.isdir(directory):
+            # A file created later in a missing directory would never produce an event
+            self._fall_back_to_polling(f"{directory} does not exist")
+            return
+        try:
+            self._observer.schedule(self._file_event_handler, directory, recursive=False)
+        except Exception as e:
+            self._fall_back_to_polling(f"could not watch {directory}: {e}")
+            return
+        self._watched_dirs.add(directory)
+    
+    def stop_file_monitoring(self) -> None:
+        """Stop the file watcher thread, if one is running"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+    
+    def _file_check_due(self) -> bool:
+        """Return True when monitored files should be checked this frame.
+        
+        With a file watcher, the check runs once FILE_EVENT_DEBOUNCE seconds
+        after the last change event, plus a slow poll every
+        WATCHER_POLL_FACTOR file check intervals; otherwise it polls on the frame interval.
+        """
+        if self._observer is None:
+            if self.frame_count < self._next_file_check:
+                return False
+            self._next_file_check += self.file_check_interval
+            return True
+        
+        if self.frame_count >= self._next_file_check:
+            self._next_file_check += self.file_check_interval * WATCHER_POLL_FACTOR
+            if not self._observer.is_alive():
+                self._fall_back_to_polling("file watcher stopped")
+            return True
+        
+        # The clock is read only while an event is arriving or a check is pending
+        if self._file_changed.is_set():
+            self._file_changed.clear()  # Cleared before the deadline is set, so a later event is not lost
+            self._file_check_deadline = time.monotonic() + FILE_EVENT_DEBOUNCE
+            return False
+        if self._file_check_deadline is None or time.monotonic() < self._file_check_deadline:
+            return False
+        self._file_check_deadline = None
+        return True
+    
+    def _reload_settings_if_changed(self, current_settings_mtime: Optional[int]) -> Optional[Settings]:
+        """Load the settings file if it was modified since the last reload.
+        
+        current_settings_mtime is the settings file's st_mtime_ns from this frame's stat (None if absent).
+        Returns the new settings, or None if the file is absent, unchanged or cannot be read.
+        A newer mtime with the same contents (a touch, or a save without edits) is not parsed.
+        """
+        if current_settings_mtime is None or current_settings_mtime <= self.last_settings_mtime:
+            return None
+        
+        try:
+            with open(self.settings_file_path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            logger.error("Error reloading settings file: %s", e)
+            return None
+        
+        self.last_settings_mtime = current_settings_mtime
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self._last_settings_digest:
+            logger.debug("Settings file %s was touched but its contents are unchanged", self.settings_file_path)
+            return None
+        self._last_settings_digest = digest
+        
+        logger.info("Settings file %s was modified. Reloading...", self.settings_file_path)
+        return Settings.load_from_bytes(data, self.settings_file_path)[0]  # Invalid contents load as defaults
+    
+    def _apply_reloaded_settings(self, new_settings: Settings) -> None:
+        """Adopt reloaded settings and apply them to the displayer and this manager"""
+        try:
+            self.settings = new_settings
+            self._cache_effect_transition_settings()
+            
+            # Apply new settings to displayer
+            self.settings.apply_to_displayer(self.displayer)
+            self.settings.apply_to_transition_manager(self)
+            
+            # Update blank time setting
+            self.blank_time_between_transitions = self.settings.transition.blank_time_between_transitions
+            logger.info("Successfully reloaded and applied settings")
+            
+            # Update text order based on shuffle setting change
+            self._update_text_order_for_shuffle_change(self.settings.transition.shuffle_text_order)
+            
+        except Exception as e:
+            logger.error("Error applying settings: %s", e)
+    
     def set_text_file_monitoring(self, file_path: str) -> None:
         """Enable monitoring of a text file for changes"""
         self.text_file_path = file_path
-        if os.path.exists(file_path):
-            self.last_file_mtime = os.path.getmtime(file_path)
-            print(f"File monitoring enabled for: {file_path}")
+        self._watch_directory(file_path)
+        mtime = _get_mtime_ns(file_path)
+        if mtime is not None:
+            self.last_file_mtime = mtime
+            logger.info("File monitoring enabled for: %s", file_path)
     
     def _check_file_changes(self) -> None:
-        """Check if the monitored text file and settings file have been modified"""
+        """Check if the monitored text file or the text file selection has been modified"""
         # Check text file changes
-        if self.text_file_path and os.path.exists(self.text_file_path):
-            current_mtime = os.path.getmtime(self.text_file_path)
+        current_mtime = _get_mtime_ns(self.text_file_path) if self.text_file_path else None
+        if current_mtime is not None:
             if current_mtime > self.last_file_mtime:
-                print(f"Text file {self.text_file_path} was modified. Reloading...")
+                logger.info("Text file %s was modified. Reloading...", self.text_file_path)
                 try:
                     self.displayer.load_text_file(self.text_file_path)
                     self.last_file_mtime = current_mtime
-                    print(f"Successfully reloaded {len(self.displayer.text_content)} text blocks")
+                    logger.info("Successfully reloaded %d text blocks", len(self.displayer.text_content))
                     
                     # Reinitialize text order with new content
                     self._initialize_text_order()
                     
                 except Exception as e:
-                    print(f"Error reloading text file: {e}")
-        
-        # Check settings file changes
-        if os.path.exists(self.settings_file_path):
-            current_settings_mtime = os.path.getmtime(self.settings_file_path)
-            if current_settings_mtime > self.last_settings_mtime:
-                print(f"Settings file {self.settings_file_path} was modified. Reloading...")
-                try:
-                    new_settings = Settings.load_from_file(self.settings_file_path)
-                    self.settings = new_settings
-                    
-                    # Apply new settings to displayer
-                    self.settings.apply_to_displayer(self.displayer)
-                    self.settings.apply_to_transition_manager(self)
-                    
-                    # Update blank time setting
-                    self.blank_time_between_transitions = self.settings.transition.blank_time_between_transitions
-                    
-                    self.last_settings_mtime = current_settings_mtime
-                    print("Successfully reloaded and applied settings")
-                    
-                    # Update text order based on shuffle setting change
-                    self._update_text_order_for_shuffle_change(self.settings.transition.shuffle_text_order)
-                    
-                except Exception as e:
-                    print(f"Error reloading settings file: {e}")
+                    logger.error("Error reloading text file: %s", e)
         
         # Check text file selection changes
-        if os.path.exists(self.text_file_selection_path):
-            current_text_selection_mtime = os.path.getmtime(self.text_file_selection_path)
+        current_text_selection_mtime = _get_mtime_ns(self.text_file_selection_path)
+        if current_text_selection_mtime is not None:
             if current_text_selection_mtime > self.last_text_selection_mtime:
-                print(f"Text file selection {self.text_file_selection_path} was modified. Switching text file...")
                 try:
-                    with open(self.text_file_selection_path, 'r', encoding='utf-8') as f:
-                        new_text_file = f.read().strip()
+                    # The selection file holds one short path; read it raw without a text wrapper
+                    fd = os.open(self.text_file_selection_path, os.O_RDONLY)
+                    try:
+                        data = os.read(fd, 4096)
+                    finally:
+                        os.close(fd)
+                    new_text_file = data.decode('utf-8', 'replace').strip()
                     
-                    if os.path.exists(new_text_file) and new_text_file != self.text_file_path:
-                        # Update monitored text file
-                        self.text_file_path = new_text_file
-                        self.last_file_mtime = os.path.getmtime(new_text_file)
-                        
-                        # Load new text file
-                        self.displayer.load_text_file(new_text_file)
-                        
-                        # Reinitialize text order with new file content
-                        self._initialize_text_order()
-                        
-                        # Start with first text block in the order
-                        first_block = self.text_order_indices[0] if self.text_order_indices else 0
-                        self.current_text_block = first_block
-                        self.displayer.display_text(first_block)
-                        
-                        print(f"Successfully switched to text file: {new_text_file}")
-                        print(f"New file contains {len(self.displayer.text_content)} text blocks")
+                    # A touch or a re-save of the same selection changes the mtime but not the content
+                    if new_text_file == self._last_text_selection_content:
+                        logger.debug("Text file selection %s was touched but still selects %s",
+                                     self.text_file_selection_path, new_text_file)
+                    elif new_text_file != self.text_file_path:
+                        # One stat both confirms the selected file exists and gives its mtime
+                        new_file_mtime = _get_mtime_ns(new_text_file)
+                        if new_file_mtime is None:
+                            logger.warning("Selected text file %s does not exist", new_text_file)
+                        else:
+                            logger.info("Text file selection %s was modified. Switching text file...", self.text_file_selection_path)
+                            
+                            # Update monitored text file
+                            self.text_file_path = new_text_file
+                            self.last_file_mtime = new_file_mtime
+                            self._watch_directory(new_text_file)
+                            
+                            # Load new text file
+                            self.displayer.load_text_file(new_text_file)
+                            
+                            # Reinitialize text order with new file content
+                            self._initialize_text_order()
+                            
+                            # Start with first text block in the order
+                            first_block = self.text_order_indices[0] if self.text_order_indices else 0
+                            self.current_text_block = first_block
+                            self.displayer.display_text(first_block)
+                            
+                            logger.info("Successfully switched to text file: %s", new_text_file)
+                            logger.info("New file contains %d text blocks", len(self.displayer.text_content))
                     
                     self.last_text_selection_mtime = current_text_selection_mtime
+                    self._last_text_selection_content = new_text_file
                     
                 except Exception as e:
-                    print(f"Error switching text file: {e}")
+                    logger.error("Error switching text file: %s", e)
     
     def update(self) -> None:
         """Update the transition manager - call this every frame"""
-        self.frame_count += 1
-        
-        # Check for file changes periodically
-        if self.frame_count % self.file_check_interval == 0:
-            self._check_file_changes()
-        
-        # Check for shuffle setting changes more frequently
-        if self.frame_count % self.shuffle_check_interval == 0:
-            self._check_shuffle_setting_changes()
-            self._check_effect_transition_setting_changes()
-        
-        # Update the screen displayer's transition first
-        self.displayer.update_transition()
+        frame_count = self.frame_count + 1
+        self.frame_count = frame_count
+        
+        # Check for file changes (on watcher events, or periodically when polling)
+        file_check_due = self._file_check_due()
+        
+        # The settings file is also checked on its own interval
+        # (with a file watcher, settings changes arrive as file events, so there is nothing to poll)
+        if self._observer is None:
+            settings_check_due = frame_count >= self._next_settings_check
+            if settings_check_due:
+                self._next_settings_check += self.settings_check_interval
+        else:
+            settings_check_due = file_check_due
+        
+        # Either check stats the settings file once and parses it at most once;
+        # a reload fans out to everything that depends on the settings
+        if file_check_due or settings_check_due:
+            new_settings = self._reload_settings_if_changed(_get_mtime_ns(self.settings_file_path))
+            if new_settings is not None:
+                self._apply_reloaded_settings(new_settings)
+                self._apply_effect_transition_setting_changes(new_settings)
+            if file_check_due:
+                self._check_file_changes()
+        
+        # Advance the text change schedule even on frames that return early below,
+        # so a change that falls during a transition or blank period is skipped, not queued
+        text_change_due = frame_count >= self._next_text_change
+        if text_change_due:
+            self._next_text_change += self.text_change_interval
         
-        # Only make changes when not currently transitioning
+        # Update the screen displayer's transition first; it is a no-op unless one is running
         if self.displayer.is_transitioning:
-            return
-        
-        # Check if we're in a blank period and if it should end
-        if self.is_in_blank_period:
-            self._check_blank_period_completion()
-            return  # Don't process text changes while in blank period
+            self.displayer.update_transition()
+            
+            # Only make changes when not currently transitioning
+            if self.displayer.is_transitioning:
+                return
         
-        # Check if it's time for a text change
-        text_change_due = self.frame_count % self.text_change_interval == 0
+        # Run the step for the current state: waiting out a blank period or showing text
+        self._tick(text_change_due)
+    
+    def _tick_running(self, text_change_due: bool) -> None:
+        """Per-frame step while showing text: start a text change when one is due"""
         if text_change_due:
-            print(f"[TIMING] Frame {self.frame_count}: Text change due! Starting text change process")
+            logger.debug("[TIMING] Frame %d: Text change due! Starting text change process", self.frame_count)
             self._handle_text_change()
     
+    def _tick_blank(self, text_change_due: bool) -> None:
+        """Per-frame step during a blank period: check whether it should end (text changes are not processed)"""
+        self._check_blank_period_completion()
+    
     def _apply_effect_transitions(self) -> None:
         """Apply effect transitions before text changes (if enabled)"""
+        if not self._any_effect_transition_enabled:
+            return
+        t = self.settings.transition
+        rng = self._rng
         
         # 1. COLOR SCHEME TRANSITION
-        if self.settings.transition.transition_color_scheme:
-            if self.settings.transition.color_scheme_order == "sequential":
+        if t.transition_color_scheme:
+            if not self._color_scheme_random:
                 # Get next color scheme from order list
                 if not self.color_scheme_order_indices:
                     self._initialize_color_scheme_order()
                 
-                next_scheme = self.color_scheme_order_indices[self.current_color_scheme_position]
-                self.current_color_scheme_position = (self.current_color_scheme_position + 1) % len(self.color_scheme_order_indices)
-                
-                # Reshuffle on cycle completion if in random mode
-                if self.current_color_scheme_position == 0 and self.settings.transition.color_scheme_order == "random":
-                    random.shuffle(self.color_scheme_order_indices)
-                    print(f"[EFFECT] Reshuffled color scheme order for new cycle")
+                position = self.current_color_scheme_position
+                next_scheme = self.color_scheme_order_indices[position]
+                position += 1
+                self.current_color_scheme_position = 0 if position >= len(self.color_scheme_order_indices) else position
                 
-                print(f"[EFFECT] Sequential color scheme: {next_scheme.value}")
+                logger.debug("[EFFECT] Sequential color scheme: %s", next_scheme.value)
             else:  # random
                 # Pick random color scheme
-                from config.enums import ColorScheme
-                next_scheme = random.choice(list(ColorScheme))
-                print(f"[EFFECT] Random color scheme: {next_scheme.value}")
+                next_scheme = rng.choice(_COLOR_SCHEMES)
+                logger.debug("[EFFECT] Random color scheme: %s", next_scheme.value)
             
             # Apply to displayer
             self.displayer.set_ghost_color_scheme(next_scheme)
         
         # 2. TRANSITION MODE TRANSITION
-        if self.settings.transition.transition_color_mode:
-            if self.settings.transition.color_mode_order == "sequential":
+        if t.transition_color_mode:
+            if not self._color_mode_random:
                 # Get next transition mode from order list
                 if not self.transition_mode_order_indices:
                     self._initialize_transition_mode_order()
                 
-                next_mode = self.transition_mode_order_indices[self.current_transition_mode_position]
-                self.current_transition_mode_position = (self.current_transition_mode_position + 1) % len(self.transition_mode_order_indices)
+                position = self.current_transition_mode_position
+                next_mode = self.transition_mode_order_indices[position]
+                position += 1
+                self.current_transition_mode_position = 0 if position >= len(self.transition_mode_order_indices) else position
                 
-                # Reshuffle on cycle completion if in random mode
-                if self.current_transition_mode_position == 0 and self.settings.transition.color_mode_order == "random":
-                    random.shuffle(self.transition_mode_order_indices)
-                    print(f"[EFFECT] Reshuffled transition mode order for new cycle")
-                
-                print(f"[EFFECT] Sequential transition mode: {next_mode.value}")
+                logger.debug("[EFFECT] Sequential transition mode: %s", next_mode.value)
             else:  # random
                 # Pick random transition mode
-                from config.enums import TransitionMode
-                next_mode = random.choice(list(TransitionMode))
-                print(f"[EFFECT] Random transition mode: {next_mode.value}")
+                next_mode = rng.choice(_TRANSITION_MODES)
+                logger.debug("[EFFECT] Random transition mode: %s", next_mode.value)
             
             # Apply to displayer
             self.displayer.set_color_transition_mode(next_mode)
         
         # 3. GHOST PARAMETERS TRANSITION
-        if self.settings.transition.transition_ghost_params:
+        overlay_kwargs = {}
+        if t.transition_ghost_params:
             # Generate random values within configured ranges
-            ghost_chance = random.uniform(
-                self.settings.transition.ghost_chance_min,
-                self.settings.transition.ghost_chance_max
+            ghost_chance = rng.uniform(
+                t.ghost_chance_min,
+                t.ghost_chance_max
             )
-            ghost_decay = random.uniform(
-                self.settings.transition.ghost_decay_min,
-                self.settings.transition.ghost_decay_max
+            ghost_decay = rng.uniform(
+                t.ghost_decay_min,
+                t.ghost_decay_max
             )
             
-            print(f"[EFFECT] Ghost params: chance={ghost_chance:.3f}, decay={ghost_decay:.4f}")
-            
-            # Apply to displayer
-            self.displayer.configure_overlay_effects(
-                ghost_chance=ghost_chance,
-                ghost_decay=ghost_decay
-            )
+            logger.debug("[EFFECT] Ghost params: chance=%.3f, decay=%.4f", ghost_chance, ghost_decay)
+            overlay_kwargs['ghost_chance'] = ghost_chance
+            overlay_kwargs['ghost_decay'] = ghost_decay
         
         # 4. FLICKER PARAMETERS TRANSITION
-        if self.settings.transition.transition_flicker_params:
+        if t.transition_flicker_params:
             # Generate random values within configured ranges
-            flicker_chance = random.uniform(
-                self.settings.transition.flicker_chance_min,
-                self.settings.transition.flicker_chance_max
+            flicker_chance = rng.uniform(
+                t.flicker_chance_min,
+                t.flicker_chance_max
             )
-            flicker_intensity = random.uniform(
-                self.settings.transition.flicker_intensity_min,
-                self.settings.transition.flicker_intensity_max
+            flicker_intensity = rng.uniform(
+                t.flicker_intensity_min,
+                t.flicker_intensity_max
             )
             
-            print(f"[EFFECT] Flicker params: chance={flicker_chance:.3f}, intensity={flicker_intensity:.3f}")
-            
-            # Apply to displayer
-            self.displayer.configure_overlay_effects(
-                flicker_chance=flicker_chance,
-                flicker_intensity=flicker_intensity
-            )
+            logger.debug("[EFFECT] Flicker params: chance=%.3f, intensity=%.3f", flicker_chance, flicker_intensity)
+            overlay_kwargs['flicker_chance'] = flicker_chance
+            overlay_kwargs['flicker_intensity'] = flicker_intensity
+        
+        # Apply ghost and flicker parameters to displayer in one call
+        if overlay_kwargs:
+            self.displayer.configure_overlay_effects(**overlay_kwargs)
         
         # 5. SPEED VARIATION
-        if self.settings.transition.transition_speed_variation:
+        if t.transition_speed_variation:
             # Generate random speed within configured range
-            speed = random.uniform(
-                self.settings.transition.speed_min,
-                self.settings.transition.speed_max
+            speed = rng.uniform(
+                t.speed_min,
+                t.speed_max
             )
             
-            print(f"[EFFECT] Speed variation: {speed:.1f} px/frame")
+            logger.debug("[EFFECT] Speed variation: %.1f px/frame", speed)
             
             # Apply to displayer
             self.displayer.set_transition_speed(speed)
@@ -513,22 +696,22 @@ class TransitionManager:
         
         # If blank time is configured, start blank period
         if self.blank_time_between_transitions > 0:
-            current_time = time.time()
             self.is_in_blank_period = True
+            self._tick = self._tick_blank
             self.blank_period_start_frame = self.frame_count
-            self.blank_period_start_time = current_time
+            self.blank_period_start_time = time.monotonic_ns()  # Read once per blank period, for the completion log
             
             # Transition to empty/blank display
-            print(f"[TIMING] Frame {self.frame_count}: Starting blank transition (target: {self.blank_time_between_transitions} frames)")
-            print(f"[DEBUG] blank_time_between_transitions = {self.blank_time_between_transitions}")
-            print(f"[DEBUG] Settings blank_time = {self.settings.transition.blank_time_between_transitions}")
+            logger.debug("[TIMING] Frame %d: Starting blank transition (target: %d frames, settings: %d)",
+                         self.frame_count, self.blank_time_between_transitions,
+                         self.settings.transition.blank_time_between_transitions)
             self.displayer.start_transition_to_blank()
             return
             
         # No blank time - apply effect transitions then transition directly to next text
         self._apply_effect_transitions()
         next_block = self._get_next_text_block()
-        print(f"[TIMING] Frame {self.frame_count}: Starting text transition to block {next_block}")
+        logger.debug("[TIMING] Frame %d: Starting text transition to block %d", self.frame_count, next_block)
         self.displayer.display_text(next_block)
         
         # Call callback if set
@@ -540,22 +723,28 @@ class TransitionManager:
         if not self.is_in_blank_period:
             return
             
-        current_time = time.time()
         frames_elapsed = self.frame_count - self.blank_period_start_frame
-        time_elapsed = current_time - self.blank_period_start_time
         
-        print(f"[TIMING] Frame {self.frame_count}: Checking blank period - {frames_elapsed}/{self.blank_time_between_transitions} frames ({time_elapsed:.2f}s)")
+        # Progress output only every debug_output_interval frames; completion is decided on frames alone
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug and frames_elapsed % self.settings.debug.debug_output_interval == 0:
+            logger.debug("[TIMING] Frame %d: Checking blank period - %d/%d frames",
+                         self.frame_count, frames_elapsed, self.blank_time_between_transitions)
         
         if frames_elapsed >= self.blank_time_between_transitions:
             self.is_in_blank_period = False
-            print(f"[TIMING] Frame {self.frame_count}: Blank period complete after {frames_elapsed} frames ({time_elapsed:.2f}s), transitioning to next text")
+            self._tick = self._tick_running
+            if debug:
+                time_elapsed = (time.monotonic_ns() - self.blank_period_start_time) / 1e9  # Read once, at completion
+                logger.debug("[TIMING] Frame %d: Blank period complete after %d frames (%.2fs), transitioning to next text",
+                             self.frame_count, frames_elapsed, time_elapsed)
             
             # Apply effect transitions now that blank period is complete
             self._apply_effect_transitions()
             
             # Immediately transition to next text
             next_block = self._get_next_text_block()
-            print(f"[TIMING] Frame {self.frame_count}: Starting text transition to block {next_block}")
+            logger.debug("[TIMING] Frame %d: Starting text transition to block %d", self.frame_count, next_block)
             self.displayer.display_text(next_block)
             
             # Call callback if set
@@ -576,17 +765,17 @@ class TransitionManager:
             # Initialize text order first
             self._initialize_text_order()
             
-            # Set initial state (empty grid)
-            for row in range(self.displayer.grid_height):
-                for col in range(self.displayer.grid_width):
-                    self.displayer.current_grid[row][col] = False
+            # Set initial state (empty grid), clearing each row in place with one slice assignment
+            empty_row = [False] * self.displayer.grid_width
+            for row in self.displayer.current_grid:
+                row[:] = empty_row
             
             # Start transition to first text block in order
             first_block = self.text_order_indices[0] if self.text_order_indices else 0
             self.displayer.display_text(first_block)
             self.current_text_block = first_block
             
-            print("Initial display started")
+            logger.info("Initial display started")
     
     def get_status(self) -> dict:
         """Get current status information"""
@@ -595,11 +784,3 @@ class TransitionManager:
             'current_text_block': self.current_text_block,
             'is_transitioning': self.displayer.is_transitioning
         }
-        self.current_text_block = (self.current_text_block + 1) % len(self.displayer.text_content)
-        self.displayer.display_text(self.current_text_block)
-        
-        # Call callback if set
-        if self.on_text_change:
-            self.on_text_change(self.current_text_block)
-        
-        print(f"Text changed to block: {self.current_text_block}")